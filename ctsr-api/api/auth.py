@@ -1,24 +1,51 @@
 """Authentication and authorization for CTSR API."""
 
+import asyncio
+import hashlib
 import logging
-from enum import Enum
-from typing import Optional
-
+import time
+from functools import lru_cache
+from typing import Final, Optional
+
+import httpx
+import jwt
+from cachetools import TLRUCache, TTLCache
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from fastapi import Depends, Header
-from jose import JWTError, jwt
+from jwt.algorithms import RSAAlgorithm
 
 from api.config import get_settings
 from api.exceptions import AuthenticationError, AuthorizationError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for an encoded JWT; Azure AD access tokens are well below this
+MAX_JWT_LENGTH = 16384
+
+AZURE_AD_JWKS_URL = "https://login.microsoftonline.com/{tenant_id}/discovery/v2.0/keys"
+
+# Parsed Azure AD signing keys by key id, refreshed at most once per TTL
+_JWKS_CACHE: TTLCache = TTLCache(maxsize=16, ttl=3600)
+_JWKS_MIN_REFRESH_INTERVAL = 60.0
+_jwks_lock = asyncio.Lock()
+# None until the first fetch (time.monotonic() may still be small shortly after boot)
+_jwks_fetched_at: Optional[float] = None
 
-class UserRole(str, Enum):
-    """User roles for authorization."""
+# Users from verified tokens, keyed by a digest of the token. A token's claims
+# cannot change, so entries live until the token expires (capped for tokens
+# without an exp claim).
+_TOKEN_CACHE_MAX_AGE = 3600.0
+_TOKEN_CACHE: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, value, now: min(value[1], now + _TOKEN_CACHE_MAX_AGE),
+    timer=time.time,
+)
 
-    VIEWER = "CTSR_VIEWER"
-    TRIAL_LEAD = "CTSR_TRIAL_LEAD"
-    ADMIN = "CTSR_ADMIN"
+
+# User roles for authorization, as issued in the Azure AD "roles" claim
+VIEWER: Final = "CTSR_VIEWER"
+TRIAL_LEAD: Final = "CTSR_TRIAL_LEAD"
+ADMIN: Final = "CTSR_ADMIN"
 
 
 class User:
@@ -33,17 +60,79 @@ class User:
     ):
         self.email = email
         self.name = name or email
-        self.roles = roles or []
+        self.roles = tuple(roles or ())
+        self._role_set = frozenset(self.roles)
         self.is_mock = is_mock
 
-    def has_role(self, required_role: UserRole) -> bool:
+    def has_role(self, required_role: str) -> bool:
         """Check if user has the required role."""
-        return required_role.value in self.roles or UserRole.ADMIN.value in self.roles
+        return required_role in self._role_set or ADMIN in self._role_set
 
     def __repr__(self) -> str:
         return f"User(email={self.email}, roles={self.roles}, is_mock={self.is_mock})"
 
 
+# Shared user returned in local development mode (AZURE_AD_ENABLED=false)
+_MOCK_USER = User(
+    email="dev@localhost",
+    name="Local Developer",
+    roles=[ADMIN],
+    is_mock=True,
+)
+
+
+async def _fetch_jwks(tenant_id: str) -> None:
+    """Fetch the Azure AD signing keys and store them in the JWKS cache."""
+    global _jwks_fetched_at
+
+    url = AZURE_AD_JWKS_URL.format(tenant_id=tenant_id)
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error("Failed to fetch Azure AD signing keys: %s", e)
+        raise AuthenticationError("Unable to retrieve token signing keys")
+
+    _jwks_fetched_at = time.monotonic()
+    for key_data in response.json().get("keys", []):
+        kid = key_data.get("kid")
+        if kid:
+            _JWKS_CACHE[kid] = RSAAlgorithm.from_jwk(key_data)
+
+
+async def _get_signing_key(kid: str, tenant_id: str) -> RSAPublicKey:
+    """
+    Get the public key for a token key id, fetching Azure AD keys on a cache miss.
+
+    Args:
+        kid: Key id from the token header
+        tenant_id: Azure AD tenant id
+
+    Returns:
+        RSAPublicKey: Public key used to verify the token signature
+
+    Raises:
+        AuthenticationError: If the key id is unknown or keys cannot be fetched
+    """
+    key = _JWKS_CACHE.get(kid)
+    if key is not None:
+        return key
+
+    async with _jwks_lock:
+        key = _JWKS_CACHE.get(kid)
+        # Unknown key ids must not trigger a fetch on every request
+        if key is None and (
+            _jwks_fetched_at is None or time.monotonic() - _jwks_fetched_at >= _JWKS_MIN_REFRESH_INTERVAL
+        ):
+            await _fetch_jwks(tenant_id)
+            key = _JWKS_CACHE.get(kid)
+
+    if key is None:
+        raise AuthenticationError("Unknown token signing key")
+    return key
+
+
 async def get_current_user(
     authorization: Optional[str] = Header(None, alias="Authorization"),
 ) -> User:
@@ -67,34 +156,44 @@ async def get_current_user(
     # Local development mode - bypass authentication
     if not settings.azure_ad_enabled:
         logger.debug("Authentication bypassed - using mock admin user")
-        return User(
-            email="dev@localhost",
-            name="Local Developer",
-            roles=[UserRole.ADMIN.value],
-            is_mock=True,
-        )
+        return _MOCK_USER
 
     # Production mode - validate JWT
     if not authorization:
         raise AuthenticationError("Missing authorization header")
 
-    # Extract Bearer token
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    # Extract Bearer token without splitting the (untrusted) header into a list
+    if len(authorization) < 8 or authorization[:7].lower() != "bearer ":
         raise AuthenticationError("Invalid authorization header format. Expected: Bearer <token>")
 
-    token = parts[1]
+    token = authorization[7:].strip()
+    if not token or " " in token:
+        raise AuthenticationError("Invalid authorization header format. Expected: Bearer <token>")
+
+    # Reject malformed tokens before handing them to the JWT library
+    if len(token) > MAX_JWT_LENGTH or token.count(".") != 2:
+        raise AuthenticationError("Malformed token")
+
+    # Skip signature verification for a token that was already verified and has not expired
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None:
+        return cached[0]
 
     try:
-        # Decode and validate JWT
-        # Note: In production, you'd validate the signature with Azure AD public keys
-        # For now, we decode without verification for the structure
+        # Decode and validate JWT against the Azure AD signing key
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not kid:
+            raise AuthenticationError("Token missing key id")
+        # The header is untrusted JSON: an unhashable kid must not reach the key cache lookup
+        if not isinstance(kid, str):
+            raise AuthenticationError("Invalid token key id")
+
         payload = jwt.decode(
             token,
-            settings.azure_ad_client_id,  # This would be the public key in production
+            await _get_signing_key(kid, settings.azure_ad_tenant_id),
             algorithms=["RS256"],
             audience=settings.azure_ad_audience,
-            options={"verify_signature": False},  # TODO: Enable signature verification in production
         )
 
         # Extract user information from token
@@ -105,21 +204,42 @@ async def get_current_user(
         if not email:
             raise AuthenticationError("Token missing user identification")
 
-        logger.info(f"Authenticated user: {email}")
-        return User(email=email, name=name, roles=roles)
+        logger.info("Authenticated user: %s", email)
+        user = User(email=email, name=name, roles=roles)
+        _TOKEN_CACHE[cache_key] = (user, payload.get("exp", float("inf")))
+        return user
 
-    except JWTError as e:
-        logger.warning(f"JWT validation failed: {str(e)}")
+    except jwt.InvalidTokenError as e:
+        logger.warning("JWT validation failed: %s", e)
         raise AuthenticationError(f"Invalid token: {str(e)}")
 
 
-def require_role(required_role: UserRole):
+def _authorization_failed(user: User, required_role: str) -> AuthorizationError:
+    """Log a failed role check and build the error to raise."""
+    logger.warning(
+        "Authorization failed: User %s (roles: %s) attempted to access endpoint requiring %s",
+        user.email,
+        user.roles,
+        required_role,
+    )
+    return AuthorizationError(
+        f"Insufficient permissions. Required role: {required_role}",
+        details={"required_role": required_role, "user_roles": user.roles},
+    )
+
+
+@lru_cache(maxsize=None)
+def require_role(required_role: str):
     """
     Dependency factory for role-based authorization.
 
+    Prefer require_viewer, require_trial_lead or require_admin for the standard roles.
+    The dependency is memoized per role, so every Depends(require_role(...)) for the
+    same role shares one callable and FastAPI resolves it once per request.
+
     Usage:
-        @app.get("/admin")
-        async def admin_endpoint(user: User = Depends(require_role(UserRole.ADMIN))):
+        @app.get("/custom")
+        async def custom_endpoint(user: User = Depends(require_role("CTSR_CUSTOM"))):
             ...
 
     Args:
@@ -132,23 +252,31 @@ def require_role(required_role: UserRole):
     async def check_role(user: User = Depends(get_current_user)) -> User:
         """Check if user has required role."""
         if not user.has_role(required_role):
-            logger.warning(
-                f"Authorization failed: User {user.email} "
-                f"(roles: {user.roles}) attempted to access endpoint requiring {required_role.value}"
-            )
-            raise AuthorizationError(
-                f"Insufficient permissions. Required role: {required_role.value}",
-                details={"required_role": required_role.value, "user_roles": user.roles},
-            )
+            raise _authorization_failed(user, required_role)
         return user
 
     return check_role
 
 
-# Convenience dependencies for common role checks
-require_viewer = require_role(UserRole.VIEWER)
-require_trial_lead = require_role(UserRole.TRIAL_LEAD)
-require_admin = require_role(UserRole.ADMIN)
+async def require_viewer(user: User = Depends(get_current_user)) -> User:
+    """Require the viewer role (admins always pass)."""
+    if VIEWER not in user._role_set and ADMIN not in user._role_set:
+        raise _authorization_failed(user, VIEWER)
+    return user
+
+
+async def require_trial_lead(user: User = Depends(get_current_user)) -> User:
+    """Require the trial lead role (admins always pass)."""
+    if TRIAL_LEAD not in user._role_set and ADMIN not in user._role_set:
+        raise _authorization_failed(user, TRIAL_LEAD)
+    return user
+
+
+async def require_admin(user: User = Depends(get_current_user)) -> User:
+    """Require the admin role."""
+    if ADMIN not in user._role_set:
+        raise _authorization_failed(user, ADMIN)
+    return user
 
 
 def get_optional_user(
@@ -165,17 +293,7 @@ def get_optional_user(
     Returns:
         Optional[User]: User if authenticated, None otherwise
     """
-    try:
-        # We can't use async in this context, so we'll implement a sync version
-        settings = get_settings()
-        if not settings.azure_ad_enabled:
-            return User(
-                email="dev@localhost",
-                name="Local Developer",
-                roles=[UserRole.ADMIN.value],
-                is_mock=True,
-            )
-        # In production, you'd validate the token here
-        return None
-    except Exception:
-        return None
+    if not get_settings().azure_ad_enabled:
+        return _MOCK_USER
+    # In production, you'd validate the token here
+    return None
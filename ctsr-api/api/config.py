@@ -2,12 +2,20 @@
 
 import os
 from functools import lru_cache
-from typing import List
+from typing import Any, List
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _as_asyncpg_url(url: str) -> str:
+    """Force the asyncpg driver for PostgreSQL URLs (e.g. postgresql:// or postgresql+psycopg2://)."""
+    scheme, sep, rest = url.partition("://")
+    if sep and (scheme in ("postgres", "postgresql") or scheme.startswith("postgresql+")):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -26,11 +34,21 @@ class Settings(BaseSettings):
     postgres_password: str = Field(default="ctsr_dev_password")
     database_url_override: str = Field(default="", alias="DATABASE_URL")
     test_database_url_override: str = Field(default="", alias="TEST_DATABASE_URL")
+    # Mostly persistent connections: overflow connections are closed on return,
+    # losing their prepared statement caches
+    db_pool_size: int = Field(default=20)
+    db_max_overflow: int = Field(default=10)
+    db_pool_timeout: float = Field(default=30.0)
+    db_null_pool: bool = Field(default=False)
+    db_pool_pre_ping: bool = Field(default=True)
+    db_statement_cache_size: int = Field(default=1024)
+    db_command_timeout: float = Field(default=30.0)
 
     # API
     api_host: str = Field(default="0.0.0.0")
     api_port: int = Field(default=8000)
     api_debug: bool = Field(default=False)
+    web_concurrency: int = Field(default=1)
 
     # Azure AD Authentication
     azure_ad_enabled: bool = Field(default=False)
@@ -44,23 +62,33 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO")
 
-    @property
-    def database_url(self) -> str:
-        """Build async PostgreSQL connection URL."""
+    # Derived values, computed once in model_post_init
+    _database_url: str = PrivateAttr(default="")
+    _cors_origins_list: List[str] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Derive the connection URL and CORS origins from the loaded fields."""
         # Use TEST_DATABASE_URL if set (for testing), then DATABASE_URL, then build from components
         if self.test_database_url_override:
-            return self.test_database_url_override
-        if self.database_url_override:
-            return self.database_url_override
-        return (
-            f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
-            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
-        )
+            self._database_url = _as_asyncpg_url(self.test_database_url_override)
+        elif self.database_url_override:
+            self._database_url = _as_asyncpg_url(self.database_url_override)
+        else:
+            self._database_url = (
+                f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
+                f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+            )
+        self._cors_origins_list = [origin.strip() for origin in self.cors_origins.split(",")]
+
+    @property
+    def database_url(self) -> str:
+        """Async PostgreSQL connection URL."""
+        return self._database_url
 
     @property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+        """CORS origins parsed from the comma-separated string."""
+        return self._cors_origins_list
 
     @field_validator("log_level")
     @classmethod
@@ -75,8 +103,10 @@ class Settings(BaseSettings):
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    # Clear cache if using explicit DATABASE_URL or TEST_DATABASE_URL
-    if os.getenv("DATABASE_URL") or os.getenv("TEST_DATABASE_URL"):
-        get_settings.cache_clear()
+    """
+    Get cached settings instance.
+
+    Settings are read from the environment once per process; call
+    ``get_settings.cache_clear()`` to reload them (e.g. in tests).
+    """
     return Settings()
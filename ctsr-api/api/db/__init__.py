@@ -1,5 +1,5 @@
 """Database layer for CTSR API."""
 
-from api.db.database import close_db, get_db, init_db
+from api.db.database import close_db, get_db, get_db_ro, init_db
 
-__all__ = ["get_db", "init_db", "close_db"]
+__all__ = ["get_db", "get_db_ro", "init_db", "close_db"]
@@ -1,5 +1,6 @@
 """SQLAlchemy declarative base and shared table metadata."""
 
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -7,3 +8,7 @@ class Base(DeclarativeBase):
     """Base class for SQLAlchemy ORM models."""
 
     pass
+
+
+# Provides the gin_trgm_ops operator class used by the search indexes
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
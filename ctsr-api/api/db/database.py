@@ -1,29 +1,83 @@
 """Database connection and session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from api.config import get_settings
 
 # Global engine and session factory
 _engine: AsyncEngine | None = None
 _async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_readonly_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB bind values with orjson."""
+    return orjson.dumps(value).decode()
+
+
+def _unique_statement_name() -> str:
+    """Name prepared statements uniquely, so they never clash on a server connection shared through PgBouncer."""
+    return f"__asyncpg_{uuid4()}__"
 
 
 def init_db() -> None:
     """Initialize database engine and session factory."""
-    global _engine, _async_session_factory
+    global _engine, _async_session_factory, _readonly_session_factory
 
     settings = get_settings()
 
+    if settings.db_null_pool:
+        # Short-lived processes (serverless, one-off jobs) should not hold idle connections
+        pool_options: dict[str, Any] = {"poolclass": NullPool}
+    else:
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            # Reuse the most recently returned connection so idle extras can time out server-side
+            "pool_use_lifo": True,
+            # A stale pooled connection (e.g. after a database restart or failover) is only
+            # found by pinging it on checkout; without the ping its next request fails
+            "pool_pre_ping": settings.db_pool_pre_ping,
+            "pool_recycle": 3600,
+        }
+
+    connect_args: dict[str, Any] = {
+        # Reuse prepared statements (and their plans) across repeated ORM queries
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "command_timeout": settings.db_command_timeout,
+        "server_settings": {
+            # JIT compilation only adds planning latency for short OLTP queries
+            "jit": "off",
+            # Server-side keepalives: let PostgreSQL notice and end backends whose client
+            # vanished (they do not probe the pooled sockets on this side)
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
+        },
+    }
+    if settings.db_statement_cache_size == 0:
+        # Statement caching is off behind PgBouncer in transaction pooling mode, where
+        # consecutive transactions may run on different server connections
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+        # PgBouncer refuses connections carrying startup parameters it does not know
+        # ("unsupported startup parameter"), so the server settings are applied to the
+        # role instead: ALTER ROLE <user> SET jit = off (keepalives: pgbouncer.ini tcp_keepalive)
+        del connect_args["server_settings"]
+
     _engine = create_async_engine(
         settings.database_url,
         echo=settings.api_debug,
-        pool_size=10,
-        max_overflow=20,
-        pool_pre_ping=True,
-        pool_recycle=3600,
+        **pool_options,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        connect_args=connect_args,
     )
 
     _async_session_factory = async_sessionmaker(
@@ -34,6 +88,16 @@ def init_db() -> None:
         autoflush=False,
     )
 
+    # Read-only sessions run each statement in autocommit mode: asyncpg sends no BEGIN,
+    # and with no transaction open there is nothing to roll back when the connection
+    # is returned, so a read request costs only its queries
+    _readonly_session_factory = async_sessionmaker(
+        _engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
 
 async def close_db() -> None:
     """Close database engine and clean up connections."""
@@ -70,6 +134,32 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting a database session on read-only endpoints.
+
+    Unlike get_db, the session runs without a transaction (autocommit), so no
+    BEGIN, COMMIT or ROLLBACK round trips are made. Each statement sees its own
+    snapshot; anything written through it would be committed immediately, so it
+    must only be used for reads.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    if _readonly_session_factory is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    async with _readonly_session_factory() as session:
+        yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory, for work that runs outside a request dependency."""
+    if _async_session_factory is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _async_session_factory
+
+
 def get_engine() -> AsyncEngine:
     """Get the database engine."""
     if _engine is None:
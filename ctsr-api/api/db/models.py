@@ -2,12 +2,12 @@
 
 from datetime import date, datetime
 from typing import List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import ARRAY, Boolean, CheckConstraint, Date, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 from sqlalchemy.sql import func
 
 from api.db.base import Base
@@ -69,11 +69,18 @@ class Vendor(Base):
     __tablename__ = "vendors"
     __table_args__ = (
         Index("idx_vendors_code", "vendor_code"),
-        Index("idx_vendors_type", "vendor_type", postgresql_where=text("is_active = TRUE")),
+        Index(
+            "idx_vendors_type",
+            "vendor_type",
+            postgresql_include=["vendor_code", "vendor_name"],
+            postgresql_where=text("is_active = TRUE"),
+        ),
         {"schema": "ctsr"},
     )
 
-    vendor_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    vendor_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     vendor_code: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     vendor_name: Mapped[str] = mapped_column(String(200), nullable=False)
     vendor_type: Mapped[str] = mapped_column(
@@ -96,7 +103,12 @@ class Vendor(Base):
 
 
 class SystemInstance(Base):
-    """System instance table - the catalog of systems."""
+    """
+    System instance table - the catalog of systems.
+
+    Wide free-text, array and JSONB columns are deferred in the "detail" group and
+    raise if accessed without being loaded; use undefer_group("detail") to load them.
+    """
 
     __tablename__ = "system_instances"
     __table_args__ = (
@@ -104,11 +116,13 @@ class SystemInstance(Base):
         Index(
             "idx_instances_category",
             "category_code",
+            postgresql_include=["instance_code", "platform_name"],
             postgresql_where=text("is_active = TRUE"),
         ),
         Index(
             "idx_instances_validation",
             "validation_status_code",
+            postgresql_include=["instance_id", "instance_code"],
             postgresql_where=text("is_active = TRUE"),
         ),
         Index("idx_instances_platform_vendor", "platform_vendor_id"),
@@ -118,10 +132,36 @@ class SystemInstance(Base):
             "data_hosting_region",
             postgresql_where=text("is_active = TRUE"),
         ),
+        # Dashboard: system counts by status (index-only scan) and recent additions
+        Index("idx_instances_active_validation", "is_active", "validation_status_code"),
+        Index("idx_instances_created", "created_at", postgresql_where=text("is_active = TRUE")),
+        # Search: trigram indexes serve ILIKE '%term%' on each searched column
+        Index(
+            "idx_instances_code_trgm",
+            "instance_code",
+            postgresql_using="gin",
+            postgresql_ops={"instance_code": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_instances_platform_name_trgm",
+            "platform_name",
+            postgresql_using="gin",
+            postgresql_ops={"platform_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_instances_name_trgm",
+            "instance_name",
+            postgresql_using="gin",
+            postgresql_ops={"instance_name": "gin_trgm_ops"},
+        ),
         {"schema": "ctsr"},
     )
+    # Fetch updated_at with UPDATE ... RETURNING, so no refresh is needed after an update
+    __mapper_args__ = {"eager_defaults": True}
 
-    instance_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    instance_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     instance_code: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     platform_vendor_id: Mapped[Optional[UUID]] = mapped_column(PGUUID(as_uuid=True))
     service_provider_id: Mapped[Optional[UUID]] = mapped_column(PGUUID(as_uuid=True))
@@ -133,26 +173,49 @@ class SystemInstance(Base):
     validation_status_code: Mapped[str] = mapped_column(String(20), nullable=False)
     validation_date: Mapped[Optional[date]] = mapped_column(Date)
     validation_expiry: Mapped[Optional[date]] = mapped_column(Date)
-    validation_evidence_link: Mapped[Optional[str]] = mapped_column(String(500))
+    validation_evidence_link: Mapped[Optional[str]] = mapped_column(
+        String(500), deferred=True, deferred_group="detail", deferred_raiseload=True
+    )
     hosting_model: Mapped[Optional[str]] = mapped_column(String(20))
     data_hosting_region: Mapped[Optional[str]] = mapped_column(String(20))
-    description: Mapped[Optional[str]] = mapped_column(Text)
-    supported_studies: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))
-    interfaces: Mapped[Optional[dict]] = mapped_column(JSONB)
+    description: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="detail", deferred_raiseload=True
+    )
+    supported_studies: Mapped[Optional[List[str]]] = mapped_column(
+        ARRAY(Text), deferred=True, deferred_group="detail", deferred_raiseload=True
+    )
+    interfaces: Mapped[Optional[dict]] = mapped_column(
+        JSONB, deferred=True, deferred_group="detail", deferred_raiseload=True
+    )
     part11_compliant: Mapped[Optional[bool]] = mapped_column(Boolean)
     annex11_compliant: Mapped[Optional[bool]] = mapped_column(Boolean)
     soc2_certified: Mapped[Optional[bool]] = mapped_column(Boolean)
     iso27001_certified: Mapped[Optional[bool]] = mapped_column(Boolean)
     last_major_change_date: Mapped[Optional[date]] = mapped_column(Date)
-    last_major_change_desc: Mapped[Optional[str]] = mapped_column(String(500))
+    last_major_change_desc: Mapped[Optional[str]] = mapped_column(
+        String(500), deferred=True, deferred_group="detail", deferred_raiseload=True
+    )
     next_planned_change_date: Mapped[Optional[date]] = mapped_column(Date)
-    next_planned_change_desc: Mapped[Optional[str]] = mapped_column(String(500))
+    next_planned_change_desc: Mapped[Optional[str]] = mapped_column(
+        String(500), deferred=True, deferred_group="detail", deferred_raiseload=True
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
     created_by: Mapped[Optional[str]] = mapped_column(String(200))
     updated_by: Mapped[Optional[str]] = mapped_column(String(200))
 
+    # Relationships in this module raise instead of lazy loading (which would block the
+    # event loop); every query that navigates one names an eager loader for it
+    trial_links: Mapped[List["TrialSystemLink"]] = relationship(
+        primaryjoin="SystemInstance.instance_id == foreign(TrialSystemLink.instance_id)",
+        back_populates="system_instance",
+        viewonly=True,
+        lazy="raise",
+    )
+    # Recent audit records as JSON objects, only loaded with with_expression()
+    audit_history: Mapped[Optional[List[dict]]] = query_expression()
+
 
 class Trial(Base):
     """Trial table - clinical trials synced from CTMS."""
@@ -160,17 +223,44 @@ class Trial(Base):
     __tablename__ = "trials"
     __table_args__ = (
         Index("idx_trials_protocol", "protocol_number"),
-        Index("idx_trials_status", "trial_status"),
+        Index("idx_trials_status", "trial_status", postgresql_include=["trial_id", "protocol_number"]),
         Index("idx_trials_lead", "trial_lead_email"),
         Index(
             "idx_trials_confirmation_due",
             "next_confirmation_due",
             postgresql_where=text("trial_status = 'ACTIVE'"),
         ),
+        # Dashboard: open trial count and recent creations
+        Index(
+            "idx_trials_open_created",
+            "created_at",
+            postgresql_where=text("trial_status NOT IN ('CLOSED', 'CANCELLED')"),
+        ),
+        # Search: trigram indexes serve ILIKE '%term%' on each searched column
+        Index(
+            "idx_trials_protocol_trgm",
+            "protocol_number",
+            postgresql_using="gin",
+            postgresql_ops={"protocol_number": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_trials_title_trgm",
+            "trial_title",
+            postgresql_using="gin",
+            postgresql_ops={"trial_title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_trials_area_trgm",
+            "therapeutic_area",
+            postgresql_using="gin",
+            postgresql_ops={"therapeutic_area": "gin_trgm_ops"},
+        ),
         {"schema": "ctsr"},
     )
 
-    trial_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    trial_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     protocol_number: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     trial_title: Mapped[str] = mapped_column(String(500), nullable=False)
     trial_phase: Mapped[Optional[str]] = mapped_column(String(20))
@@ -189,6 +279,14 @@ class Trial(Base):
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
 
+    system_links: Mapped[List["TrialSystemLink"]] = relationship(
+        primaryjoin="Trial.trial_id == foreign(TrialSystemLink.trial_id)",
+        order_by="TrialSystemLink.linked_at.desc()",
+        back_populates="trial",
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class TrialSystemLink(Base):
     """Trial-system link table - many-to-many relationship."""
@@ -205,10 +303,25 @@ class TrialSystemLink(Base):
             unique=True,
             postgresql_where=text("assignment_status NOT IN ('REPLACED', 'LOCKED')"),
         ),
+        # Current (not unlinked) links of a trial, or of a trial and system: link checks,
+        # link updates, unlinking, confirmation snapshots and the trial detail
+        Index(
+            "idx_links_current",
+            "trial_id",
+            "instance_id",
+            postgresql_where=text("unlinked_at IS NULL"),
+        ),
+        # Dashboard: active links by criticality, joined to their systems
+        Index(
+            "idx_links_active_instance",
+            "instance_id",
+            postgresql_include=["trial_id", "criticality_code"],
+            postgresql_where=text("assignment_status = 'ACTIVE'"),
+        ),
         {"schema": "ctsr"},
     )
 
-    link_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    link_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     trial_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     instance_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     assignment_status: Mapped[str] = mapped_column(String(30), nullable=False, default="ACTIVE")
@@ -223,6 +336,20 @@ class TrialSystemLink(Base):
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
 
+    # Read-only navigation for eager loading; links are written through the id columns
+    trial: Mapped["Trial"] = relationship(
+        primaryjoin="foreign(TrialSystemLink.trial_id) == Trial.trial_id",
+        back_populates="system_links",
+        viewonly=True,
+        lazy="raise",
+    )
+    system_instance: Mapped["SystemInstance"] = relationship(
+        primaryjoin="foreign(TrialSystemLink.instance_id) == SystemInstance.instance_id",
+        back_populates="trial_links",
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class Confirmation(Base):
     """Confirmation table - periodic and DB lock confirmations."""
@@ -230,16 +357,26 @@ class Confirmation(Base):
     __tablename__ = "confirmations"
     __table_args__ = (
         Index("idx_confirmations_trial", "trial_id"),
-        Index("idx_confirmations_status", "confirmation_status"),
+        Index("idx_confirmations_status", "confirmation_status", postgresql_include=["due_date", "confirmed_date"]),
         Index(
             "idx_confirmations_due",
             "due_date",
             postgresql_where=text("confirmation_status = 'PENDING'"),
         ),
+        # Dashboard: recent submissions
+        Index(
+            "idx_confirmations_completed",
+            "confirmed_date",
+            postgresql_where=text("confirmation_status = 'COMPLETED'"),
+        ),
         {"schema": "ctsr"},
     )
+    # Fetch server-generated columns with INSERT ... RETURNING, so no refresh is needed after commit
+    __mapper_args__ = {"eager_defaults": True}
 
-    confirmation_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    confirmation_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     trial_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     confirmation_type: Mapped[str] = mapped_column(String(20), nullable=False)
     confirmation_status: Mapped[str] = mapped_column(String(20), nullable=False, default="PENDING")
@@ -253,6 +390,19 @@ class Confirmation(Base):
     export_id: Mapped[Optional[UUID]] = mapped_column(PGUUID(as_uuid=True))
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
 
+    # Read-only navigation for eager loading; snapshots are written by INSERT ... SELECT
+    trial: Mapped["Trial"] = relationship(
+        primaryjoin="foreign(Confirmation.trial_id) == Trial.trial_id",
+        viewonly=True,
+        lazy="raise",
+    )
+    snapshots: Mapped[List["LinkSnapshot"]] = relationship(
+        primaryjoin="Confirmation.confirmation_id == foreign(LinkSnapshot.confirmation_id)",
+        order_by="LinkSnapshot.created_at.desc()",
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class LinkSnapshot(Base):
     """Link snapshot table - point-in-time captures at confirmation."""
@@ -264,7 +414,9 @@ class LinkSnapshot(Base):
         {"schema": "ctsr"},
     )
 
-    snapshot_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    snapshot_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     confirmation_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     link_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     instance_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
@@ -273,6 +425,12 @@ class LinkSnapshot(Base):
     platform_version_at: Mapped[Optional[str]] = mapped_column(String(50))
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
 
+    system_instance: Mapped["SystemInstance"] = relationship(
+        primaryjoin="foreign(LinkSnapshot.instance_id) == SystemInstance.instance_id",
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class UploadLog(Base):
     """Upload log table - vendor upload processing records."""
@@ -285,13 +443,18 @@ class UploadLog(Base):
         {"schema": "ctsr"},
     )
 
-    upload_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    upload_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     vendor_code: Mapped[str] = mapped_column(String(50), nullable=False)
     upload_type: Mapped[str] = mapped_column(String(20), nullable=False)
     file_name: Mapped[Optional[str]] = mapped_column(String(500))
     file_size_bytes: Mapped[Optional[int]] = mapped_column(Integer)
     processing_status: Mapped[str] = mapped_column(String(20), nullable=False, default="PENDING")
-    raw_json: Mapped[Optional[dict]] = mapped_column(JSONB)
+    # Deprecated: payloads belong in object storage, referenced by raw_json_url/raw_json_sha256
+    raw_json: Mapped[Optional[dict]] = mapped_column(JSONB, deferred=True)
+    raw_json_url: Mapped[Optional[str]] = mapped_column(String(1000))
+    raw_json_sha256: Mapped[Optional[str]] = mapped_column(String(64))
     schema_version: Mapped[Optional[str]] = mapped_column(String(10))
     instances_in_file: Mapped[Optional[int]] = mapped_column(Integer)
     instances_created: Mapped[int] = mapped_column(Integer, default=0)
@@ -309,12 +472,15 @@ class SystemInstanceAudit(Base):
 
     __tablename__ = "system_instances_audit"
     __table_args__ = (
-        Index("idx_audit_instance", "instance_id"),
+        # Newest changes of an instance first, read straight off the index
+        Index("idx_audit_instance", "instance_id", "changed_at"),
         Index("idx_audit_changed", "changed_at"),
         {"schema": "ctsr"},
     )
 
-    audit_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    audit_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     instance_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     action: Mapped[str] = mapped_column(String(10), nullable=False)
     changed_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
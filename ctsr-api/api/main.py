@@ -1,33 +1,55 @@
 """Main FastAPI application for CTSR API."""
 
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 
 from api import __version__
 from api.config import get_settings
 from api.db import close_db, init_db
-from api.exceptions import CTSRException
+from api.db.base import Base
+from api.middleware import ExceptionMiddleware
+from api.routers import admin, confirmations, health, lookups, systems, trials, vendors
+
+settings = get_settings()
 
 # Configure logging
 logging.basicConfig(
-    level=get_settings().log_level,
+    level=settings.log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Hand log records to a background thread so handler I/O never blocks the event loop
+_root_logger = logging.getLogger()
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Application lifespan events."""
     # Startup
+    _log_listener.start()
     logger.info("Starting CTSR API...")
     init_db()
     logger.info("Database initialized")
+    # Resolve relationships and mapper configuration up front rather than on the first query
+    Base.registry.configure()
+    try:
+        await lookups.load_lookups()
+    except Exception:
+        logger.warning("Could not preload lookups; they will be loaded on first request", exc_info=True)
+    # Build the OpenAPI schema now; FastAPI keeps it in app.openapi_schema so /docs
+    # and /openapi.json never pay for walking every model on the first request
+    app.openapi()
 
     yield
 
@@ -35,6 +57,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info("Shutting down CTSR API...")
     await close_db()
     logger.info("Database connections closed")
+    _log_listener.stop()
 
 
 # Create FastAPI app
@@ -46,8 +69,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Error responses are produced inside CORS so they still carry CORS headers
+app.add_middleware(ExceptionMiddleware)
+
 # Configure CORS
-settings = get_settings()
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
@@ -56,39 +81,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-# Exception handlers
-@app.exception_handler(CTSRException)
-async def ctsr_exception_handler(request: Request, exc: CTSRException) -> JSONResponse:
-    """Handle custom CTSR exceptions."""
-    logger.error(f"CTSR Exception: {exc.error_code} - {exc.message}", extra={"details": exc.details})
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": exc.error_code,
-            "message": exc.message,
-            "details": exc.details,
-        },
-    )
-
-
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle unexpected exceptions."""
-    logger.exception("Unhandled exception", exc_info=exc)
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "INTERNAL_SERVER_ERROR",
-            "message": "An unexpected error occurred",
-            "details": {},
-        },
-    )
-
+# Compress list and lookup payloads; level 5 keeps most of level 9's ratio for far less CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Register routers
-from api.routers import admin, confirmations, health, lookups, systems, trials, vendors
-
 app.include_router(health.router, tags=["Health"])
 app.include_router(lookups.router, prefix="/api/v1", tags=["Lookups"])
 app.include_router(vendors.router, prefix="/api/v1", tags=["Vendors"])
@@ -117,4 +113,7 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_debug,
+        workers=None if settings.api_debug else settings.web_concurrency,
+        loop="auto",
+        http="httptools",
     )
@@ -0,0 +1,65 @@
+"""ASGI middleware for CTSR API."""
+
+import logging
+from typing import Any, Dict
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.exceptions import CTSRException
+
+logger = logging.getLogger(__name__)
+
+
+class ExceptionMiddleware:
+    """
+    Convert exceptions raised by the application into JSON error responses.
+
+    Implemented as a plain ASGI middleware so it adds no per-request task or
+    request/response wrapping, unlike BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except CTSRException as exc:
+            logger.error(f"CTSR Exception: {exc.error_code} - {exc.message}", extra={"details": exc.details})
+            if response_started:
+                raise
+            await self._send_error(send, exc.status_code, exc.error_code, exc.message, exc.details)
+        except Exception as exc:
+            logger.exception("Unhandled exception", exc_info=exc)
+            if response_started:
+                raise
+            await self._send_error(send, 500, "INTERNAL_SERVER_ERROR", "An unexpected error occurred", {})
+
+    @staticmethod
+    async def _send_error(send: Send, status_code: int, error: str, message: str, details: Dict[str, Any]) -> None:
+        """Send a JSON error response in the API's standard error format."""
+        body = orjson.dumps({"error": error, "message": message, "details": details})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -18,6 +18,16 @@ class TrialSummary(BaseModel):
     trials_with_alerts: int = Field(..., description="Trials with validation alerts")
 
 
+class CriticalityCounts(BaseModel):
+    """Active trial-system link counts per criticality level."""
+
+    crit: int = Field(0, alias="CRIT", description="Critical")
+    maj: int = Field(0, alias="MAJ", description="Major")
+    std: int = Field(0, alias="STD", description="Standard")
+
+    model_config = {"populate_by_name": True}
+
+
 class SystemSummary(BaseModel):
     """Summary statistics for systems."""
 
@@ -25,7 +35,7 @@ class SystemSummary(BaseModel):
     active_systems: int = Field(..., description="Active system instances")
     validated_systems: int = Field(..., description="Systems with VALIDATED status")
     systems_needing_validation: int = Field(..., description="Systems needing validation")
-    systems_by_criticality: dict[str, int] = Field(..., description="System count by criticality")
+    systems_by_criticality: CriticalityCounts = Field(..., description="System count by criticality")
 
 
 class ConfirmationSummary(BaseModel):
@@ -4,7 +4,9 @@ from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from api.utils.pagination import PaginationMeta
 
 
 # Confirmation Models
@@ -82,7 +84,7 @@ class ConfirmationDetail(BaseModel):
     export_generated: bool
     export_id: Optional[UUID]
     created_at: datetime
-    snapshots: List[SystemSnapshotSummary] = []
+    snapshots: List[SystemSnapshotSummary]
 
     model_config = {"from_attributes": True}
 
@@ -91,7 +93,11 @@ class ConfirmationListResponse(BaseModel):
     """Response model for confirmation list."""
 
     data: List[ConfirmationResponse]
-    meta: dict
+    meta: PaginationMeta
+
+
+confirmation_adapter: TypeAdapter[ConfirmationResponse] = TypeAdapter(ConfirmationResponse)
+confirmation_list_adapter: TypeAdapter[List[ConfirmationResponse]] = TypeAdapter(List[ConfirmationResponse])
 
 
 # Export Models
@@ -4,10 +4,13 @@ from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from api.utils.pagination import PaginationMeta
 
+# Letters, digits, underscores and hyphens
+INSTANCE_CODE_PATTERN = r"^[a-zA-Z0-9_\-]+$"
+
 
 class InterfaceModel(BaseModel):
     """Model for system interface."""
@@ -34,7 +37,7 @@ class SystemCreate(BaseModel):
         min_length=5,
         max_length=100,
         description="Unique instance code",
-        pattern="^[a-zA-Z0-9_\\-]+$",
+        pattern=INSTANCE_CODE_PATTERN,
     )
     platform_vendor_id: Optional[UUID] = Field(None, description="Platform vendor UUID")
     service_provider_id: Optional[UUID] = Field(None, description="Service provider UUID")
@@ -154,8 +157,8 @@ class TrialLinkSummary(BaseModel):
 class SystemDetail(SystemResponse):
     """Detailed system response with linked trials and audit history."""
 
-    linked_trials: List[TrialLinkSummary] = Field(default_factory=list, description="Linked trials")
-    audit_history: List[AuditRecord] = Field(default_factory=list, description="Change history")
+    linked_trials: List[TrialLinkSummary] = Field(..., description="Linked trials")
+    audit_history: List[AuditRecord] = Field(..., description="Change history")
 
 
 class SystemListResponse(BaseModel):
@@ -163,3 +166,9 @@ class SystemListResponse(BaseModel):
 
     data: List[SystemResponse]
     meta: PaginationMeta
+
+
+system_adapter: TypeAdapter[SystemResponse] = TypeAdapter(SystemResponse)
+
+# Validates a whole page of ORM rows in one call instead of per-row model_validate
+system_list_adapter: TypeAdapter[List[SystemResponse]] = TypeAdapter(List[SystemResponse])
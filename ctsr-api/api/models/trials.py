@@ -4,7 +4,9 @@ from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from api.utils.pagination import PaginationMeta
 
 
 # Trial Models
@@ -122,6 +124,12 @@ class LinkedSystemDetail(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class LinkedSystemListResponse(BaseModel):
+    """Response model for the systems linked to a trial."""
+
+    data: List[LinkedSystemDetail]
+
+
 class TrialDetail(BaseModel):
     """Detailed trial response with linked systems."""
 
@@ -140,7 +148,7 @@ class TrialDetail(BaseModel):
     next_confirmation_due: Optional[date]
     created_at: datetime
     updated_at: datetime
-    linked_systems: List[LinkedSystemDetail] = []
+    linked_systems: List[LinkedSystemDetail]
 
     model_config = {"from_attributes": True}
 
@@ -149,4 +157,8 @@ class TrialListResponse(BaseModel):
     """Response model for trial list."""
 
     data: List[TrialResponse]
-    meta: dict
+    meta: PaginationMeta
+
+
+trial_adapter: TypeAdapter[TrialResponse] = TypeAdapter(TrialResponse)
+trial_list_adapter: TypeAdapter[List[TrialResponse]] = TypeAdapter(List[TrialResponse])
@@ -1,13 +1,30 @@
 """Pydantic models for vendor endpoints."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter
 
 from api.utils.pagination import PaginationMeta
 
+# Upper-case identifier, e.g. ICON_CRO
+VENDOR_CODE_PATTERN = r"^[A-Z0-9_]+$"
+
+# Mirrors the vendor_type check constraint on ctsr.vendors
+VendorType = Literal[
+    "CRO",
+    "FSP",
+    "TECH_VENDOR",
+    "CENTRAL_LAB",
+    "IMAGING",
+    "ECG_VENDOR",
+    "BIOANALYTICAL",
+    "LOGISTICS",
+    "SPECIALTY",
+    "INTERNAL",
+]
+
 
 class VendorCreate(BaseModel):
     """Request model for creating a vendor."""
@@ -17,68 +34,23 @@ class VendorCreate(BaseModel):
         min_length=2,
         max_length=50,
         description="Unique vendor code (e.g., ICON_CRO)",
-        pattern="^[A-Z0-9_]+$",
+        pattern=VENDOR_CODE_PATTERN,
     )
     vendor_name: str = Field(..., min_length=1, max_length=200, description="Display name")
-    vendor_type: str = Field(
-        ...,
-        description="Vendor type",
-    )
+    vendor_type: VendorType = Field(..., description="Vendor type")
     contact_name: Optional[str] = Field(None, max_length=200, description="Primary contact name")
     contact_email: Optional[str] = Field(None, max_length=200, description="Primary contact email")
 
-    @field_validator("vendor_type")
-    @classmethod
-    def validate_vendor_type(cls, v: str) -> str:
-        """Validate vendor type."""
-        valid_types = [
-            "CRO",
-            "FSP",
-            "TECH_VENDOR",
-            "CENTRAL_LAB",
-            "IMAGING",
-            "ECG_VENDOR",
-            "BIOANALYTICAL",
-            "LOGISTICS",
-            "SPECIALTY",
-            "INTERNAL",
-        ]
-        if v not in valid_types:
-            raise ValueError(f"vendor_type must be one of: {', '.join(valid_types)}")
-        return v
-
 
 class VendorUpdate(BaseModel):
     """Request model for updating a vendor."""
 
     vendor_name: Optional[str] = Field(None, min_length=1, max_length=200, description="Display name")
-    vendor_type: Optional[str] = Field(None, description="Vendor type")
+    vendor_type: Optional[VendorType] = Field(None, description="Vendor type")
     contact_name: Optional[str] = Field(None, max_length=200, description="Primary contact name")
     contact_email: Optional[str] = Field(None, max_length=200, description="Primary contact email")
     is_active: Optional[bool] = Field(None, description="Active status")
 
-    @field_validator("vendor_type")
-    @classmethod
-    def validate_vendor_type(cls, v: Optional[str]) -> Optional[str]:
-        """Validate vendor type."""
-        if v is None:
-            return v
-        valid_types = [
-            "CRO",
-            "FSP",
-            "TECH_VENDOR",
-            "CENTRAL_LAB",
-            "IMAGING",
-            "ECG_VENDOR",
-            "BIOANALYTICAL",
-            "LOGISTICS",
-            "SPECIALTY",
-            "INTERNAL",
-        ]
-        if v not in valid_types:
-            raise ValueError(f"vendor_type must be one of: {', '.join(valid_types)}")
-        return v
-
 
 class VendorResponse(BaseModel):
     """Response model for vendor."""
@@ -100,3 +72,6 @@ class VendorListResponse(BaseModel):
 
     data: List[VendorResponse] = Field(..., description="List of vendors")
     meta: PaginationMeta = Field(..., description="Pagination metadata")
+
+
+vendor_list_adapter: TypeAdapter[List[VendorResponse]] = TypeAdapter(List[VendorResponse])
@@ -4,26 +4,30 @@ Admin Router
 API endpoints for admin dashboard and administrative operations.
 """
 
-from fastapi import APIRouter, Depends
+import asyncio
+
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.auth import User, UserRole, require_role
-from api.db import get_db
+from api.auth import User, require_admin
+from api.db import get_db_ro
 from api.models.admin import DashboardStats
 from api.services.admin import AdminService
+from api.utils.cache import dashboard_cache, lookups_cache
 
 router = APIRouter()
 
+# Serializes dashboard rebuilds so a cache miss runs the statement once, not once per waiting request
+_rebuild_lock = asyncio.Lock()
+
 
 @router.get(
     "/dashboard",
-    response_model=DashboardStats,
+    responses={200: {"model": DashboardStats}},
     summary="Get dashboard statistics",
     description="Get comprehensive dashboard statistics including trials, systems, confirmations, and recent activities. Admin access required.",
 )
-async def get_dashboard(
-    db: AsyncSession = Depends(get_db), user: User = Depends(require_role(UserRole.ADMIN))
-) -> DashboardStats:
+async def get_dashboard(db: AsyncSession = Depends(get_db_ro), user: User = Depends(require_admin)) -> Response:
     """
     Get comprehensive dashboard statistics.
 
@@ -38,6 +42,42 @@ async def get_dashboard(
 
     **Returns:**
     - Dashboard statistics with all aggregated counts and recent activities
+
+    The JSON document is built by the database and returned as-is. Statistics are
+    cached in-process for up to 30 seconds with the version of the tables they were
+    built from; each request only reads the version, and the statistics are rebuilt
+    when it differs, so writes made through any worker are reflected by all of them.
     """
     service = AdminService(db)
-    return await service.get_dashboard_stats()
+    version = await service.get_dashboard_version()
+    cached = dashboard_cache.get("dashboard")
+    if cached is None or cached[0] != version:
+        async with _rebuild_lock:
+            # Another request may have rebuilt the statistics while this one waited
+            cached = dashboard_cache.get("dashboard")
+            if cached is None or cached[0] != version:
+                # The version is read before the statistics, so a concurrent write leaves
+                # a stale version (and a rebuild on the next request), never stale statistics
+                cached = dashboard_cache["dashboard"] = (version, await service.get_dashboard_json())
+    return Response(content=cached[1], media_type="application/json")
+
+
+@router.delete(
+    "/cache/lookups",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Drop cached reference data",
+    description="Drops the reference data cached by the worker process serving this request, so its next "
+    "/lookups request reloads it. Changes to the reference tables are detected by every worker without "
+    "this call. Admin access required.",
+)
+async def clear_lookups_cache(user: User = Depends(require_admin)) -> Response:
+    """
+    Drop this worker's cached /lookups response.
+
+    Other workers keep their copies; every worker reloads on its own once the
+    lookup tables' version changes.
+
+    **Requires:** ADMIN role
+    """
+    lookups_cache.clear()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -4,11 +4,11 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.auth import User, UserRole, get_current_user, require_role
-from api.db.database import get_db
+from api.auth import User, require_trial_lead, require_viewer
+from api.db.database import get_db, get_db_ro
 from api.models.confirmations import (
     ConfirmationCreate,
     ConfirmationDetail,
@@ -18,8 +18,11 @@ from api.models.confirmations import (
     ConfirmationUpdate,
     ExportRequest,
     ExportResponse,
+    confirmation_adapter,
+    confirmation_list_adapter,
 )
 from api.services.confirmations import ConfirmationService
+from api.utils.ndjson import NDJSON_RESPONSES, ndjson_response, wants_ndjson
 from api.utils.pagination import PaginationParams
 
 logger = logging.getLogger(__name__)
@@ -27,42 +30,59 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/confirmations", tags=["confirmations"])
 
 
-@router.get("", response_model=ConfirmationListResponse, status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=ConfirmationListResponse,
+    status_code=status.HTTP_200_OK,
+    responses=NDJSON_RESPONSES,
+)
 async def list_confirmations(
+    request: Request,
     trial_id: Optional[UUID] = Query(None, description="Filter by trial ID"),
     confirmation_status: Optional[str] = Query(None, description="Filter by status (PENDING/COMPLETED/OVERDUE)"),
     confirmation_type: Optional[str] = Query(None, description="Filter by type (PERIODIC/DB_LOCK)"),
     overdue_only: bool = Query(False, description="Show only overdue confirmations"),
     pagination: PaginationParams = Depends(),
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.VIEWER)),
+    db: AsyncSession = Depends(get_db_ro),
+    user: User = Depends(require_viewer),
 ):
     """
     List all confirmations with optional filters.
 
+    With `Accept: application/x-ndjson` the page is streamed as one confirmation
+    per line, without pagination metadata.
+
     **Permissions:** VIEWER, TRIAL_LEAD, ADMIN
     """
-    confirmations, meta = await ConfirmationService.list_confirmations(
-        db=db,
-        pagination=pagination,
+    filters = dict(
         trial_id=trial_id,
         confirmation_status=confirmation_status,
         confirmation_type=confirmation_type,
         overdue_only=overdue_only,
-        user_email=user.email,
+    )
+    if wants_ndjson(request):
+        rows = ConfirmationService.iter_confirmations(db=db, pagination=pagination, **filters, user_email=user.email)
+        return ndjson_response(rows, confirmation_adapter)
+
+    confirmations, meta = await ConfirmationService.list_confirmations(
+        db=db, pagination=pagination, **filters, user_email=user.email
     )
 
     return ConfirmationListResponse(
-        data=[ConfirmationResponse.model_validate(conf) for conf in confirmations],
-        meta=meta.model_dump(),
+        data=confirmation_list_adapter.validate_python(confirmations),
+        meta=meta,
     )
 
 
-@router.post("", response_model=ConfirmationResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=ConfirmationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_confirmation(
     confirmation_data: ConfirmationCreate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Create a new confirmation for a trial.
@@ -77,8 +97,8 @@ async def create_confirmation(
 @router.get("/{confirmation_id}", response_model=ConfirmationDetail, status_code=status.HTTP_200_OK)
 async def get_confirmation(
     confirmation_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.VIEWER)),
+    db: AsyncSession = Depends(get_db_ro),
+    user: User = Depends(require_viewer),
 ):
     """
     Get confirmation details including system snapshots.
@@ -88,12 +108,16 @@ async def get_confirmation(
     return await ConfirmationService.get_confirmation(db=db, confirmation_id=confirmation_id, user_email=user.email)
 
 
-@router.put("/{confirmation_id}", response_model=ConfirmationResponse, status_code=status.HTTP_200_OK)
+@router.put(
+    "/{confirmation_id}",
+    response_model=ConfirmationResponse,
+    status_code=status.HTTP_200_OK,
+)
 async def update_confirmation(
     confirmation_id: UUID,
     confirmation_data: ConfirmationUpdate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Update a confirmation (only pending confirmations can be updated).
@@ -117,7 +141,7 @@ async def submit_confirmation(
     confirmation_id: UUID,
     submit_data: ConfirmationSubmit,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Submit a confirmation and optionally capture system snapshots.
@@ -136,7 +160,7 @@ async def submit_confirmation(
 async def generate_export(
     export_request: ExportRequest,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Generate an eTMF export for a completed confirmation.
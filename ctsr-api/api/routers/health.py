@@ -1,17 +1,23 @@
 """Health check endpoint."""
 
-from datetime import datetime
+import asyncio
+import time
+from datetime import datetime, timezone
 from enum import Enum
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.db import get_db
+from api.db.database import get_session_factory
 
 router = APIRouter()
 
+# Seconds a database check result is reused, and the time allowed for a check
+HEALTH_CHECK_INTERVAL = 2.0
+HEALTH_CHECK_TIMEOUT = 0.5
+
 
 class HealthStatus(str, Enum):
     """Health status values."""
@@ -29,31 +35,55 @@ class HealthResponse(BaseModel):
     timestamp: datetime
 
 
+# Monotonic time of the last database check and its result
+_last_check: Optional[Tuple[float, HealthResponse]] = None
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
     summary="Service health and readiness",
     description="Check the health status of the API and its dependencies. No authentication required.",
 )
-async def get_health(db: AsyncSession = Depends(get_db)) -> HealthResponse:
+async def get_health() -> HealthResponse:
     """
     Check service health and database connectivity.
 
+    The database check runs at most once every HEALTH_CHECK_INTERVAL seconds;
+    probes in between get the last result, so frequent liveness/readiness
+    probes do not each take a pooled connection.
+
     Returns:
         HealthResponse: Health status information
     """
+    global _last_check
+
+    if _last_check is not None and time.monotonic() - _last_check[0] < HEALTH_CHECK_INTERVAL:
+        return _last_check[1]
+
     # Test database connection
     try:
-        result = await db.execute(text("SELECT 1"))
-        result.scalar()
+        await asyncio.wait_for(_ping_database(), timeout=HEALTH_CHECK_TIMEOUT)
         db_status = "connected"
         overall_status = HealthStatus.HEALTHY
+    except asyncio.TimeoutError:
+        db_status = "error: timed out"
+        overall_status = HealthStatus.UNHEALTHY
     except Exception as e:
         db_status = f"error: {str(e)}"
         overall_status = HealthStatus.UNHEALTHY
 
-    return HealthResponse(
+    health = HealthResponse(
         status=overall_status,
         database=db_status,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
+    _last_check = (time.monotonic(), health)
+    return health
+
+
+async def _ping_database() -> None:
+    """Run a trivial query on a pooled connection."""
+    async with get_session_factory()() as db:
+        result = await db.execute(text("SELECT 1"))
+        result.scalar()
@@ -1,31 +1,70 @@
 """Lookups/reference data endpoints."""
 
-from fastapi import APIRouter, Depends
+import asyncio
+
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.db import get_db
+from api.db.database import get_db_ro, get_session_factory
 from api.models.lookups import LookupsResponse
 from api.services.lookups import LookupsService
+from api.utils.cache import lookups_cache
+from api.utils.etag import etag_response
 
 router = APIRouter()
 
+# Serializes reloads so an expired cache is refilled by one request, not every concurrent one
+_reload_lock = asyncio.Lock()
+
+
+async def load_lookups() -> tuple[str, bytes]:
+    """
+    Fetch all lookup tables and cache the serialized response with their version.
+
+    Called at startup and whenever the cached copy has expired, been dropped or is
+    older than the tables. The version is read first, so a concurrent change leaves
+    a stale version (and a reload on the next request), never a stale body.
+
+    Returns:
+        tuple: Lookup tables version and LookupsResponse JSON
+    """
+    async with get_session_factory()() as db:
+        version = await LookupsService.get_version(db)
+        lookups = await LookupsService.get_all_lookups(db)
+    cached = lookups_cache["lookups"] = (version, lookups.model_dump_json().encode())
+    return cached
+
 
 @router.get(
     "/lookups",
-    response_model=LookupsResponse,
+    responses={200: {"model": LookupsResponse}},
     summary="Get all reference data",
     description="Returns all lookup tables for client-side caching. "
     "Includes system categories, validation statuses, criticality levels, "
     "vendor types, hosting models, and data hosting regions.",
 )
-async def get_lookups(db: AsyncSession = Depends(get_db)) -> LookupsResponse:
+async def get_lookups(request: Request, db: AsyncSession = Depends(get_db_ro)) -> Response:
     """
     Fetch all reference/lookup data.
 
     This endpoint returns all lookup tables in a single response for efficient
     client-side caching. No authentication required.
 
+    The serialized response is loaded at startup and cached in-process. Each
+    request only reads the tables' version, and the tables themselves are reloaded
+    when it differs from the cached one, so changes made through any worker (or
+    directly in the database) are served by all of them.
+    Clients revalidating with If-None-Match get 304 Not Modified.
+
     Returns:
-        LookupsResponse: All reference data
+        LookupsResponse JSON
     """
-    return await LookupsService.get_all_lookups(db)
+    version = await LookupsService.get_version(db)
+    cached = lookups_cache.get("lookups")
+    if cached is None or cached[0] != version:
+        async with _reload_lock:
+            # Another request may have reloaded the lookups while this one waited
+            cached = lookups_cache.get("lookups")
+            if cached is None or cached[0] != version:
+                cached = await load_lookups()
+    return etag_response(request, cached[1])
@@ -3,13 +3,23 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.auth import User, require_admin, require_viewer
-from api.db import get_db
-from api.models.systems import SystemCreate, SystemDetail, SystemListResponse, SystemResponse, SystemUpdate
+from api.db import get_db, get_db_ro
+from api.models.systems import (
+    SystemCreate,
+    SystemDetail,
+    SystemListResponse,
+    SystemResponse,
+    SystemUpdate,
+    system_adapter,
+)
 from api.services.systems import SystemService
+from api.utils.etag import etag_response
+from api.utils.ndjson import NDJSON_RESPONSES, ndjson_response, wants_ndjson
 from api.utils.pagination import PaginationParams
 
 router = APIRouter()
@@ -18,10 +28,12 @@ router = APIRouter()
 @router.get(
     "/systems",
     response_model=SystemListResponse,
+    responses=NDJSON_RESPONSES,
     summary="List system instances",
     description="Returns a paginated list of system instances with optional filtering and search.",
 )
 async def list_systems(
+    request: Request,
     category_code: Optional[str] = Query(None, description="Filter by system category"),
     validation_status: Optional[str] = Query(None, description="Filter by validation status"),
     data_hosting_region: Optional[str] = Query(None, description="Filter by data hosting region"),
@@ -29,15 +41,19 @@ async def list_systems(
     is_active: bool = Query(True, description="Filter by active status"),
     search: Optional[str] = Query(None, description="Search in instance_code, platform_name, instance_name"),
     pagination: PaginationParams = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
     user: User = Depends(require_viewer),
-) -> SystemListResponse:
+) -> SystemListResponse | StreamingResponse:
     """
     List all system instances with pagination, filtering, and search.
 
+    With `Accept: application/x-ndjson` the page is streamed as one system per
+    line, without pagination metadata.
+
     Requires CTSR_VIEWER role or higher.
 
     Args:
+        request: Incoming request (its Accept header selects NDJSON)
         category_code: Optional filter by category (EDC, IRT, etc.)
         validation_status: Optional filter by validation status
         data_hosting_region: Optional filter by hosting region
@@ -49,19 +65,21 @@ async def list_systems(
         user: Authenticated user
 
     Returns:
-        SystemListResponse: Paginated list of systems
+        SystemListResponse: Paginated list of systems, or an NDJSON stream
     """
-    return await SystemService.list_systems(
-        db=db,
-        pagination=pagination,
+    filters = dict(
         category_code=category_code,
         validation_status=validation_status,
         data_hosting_region=data_hosting_region,
         vendor_id=vendor_id,
         is_active=is_active,
         search=search,
-        user_email=user.email,
     )
+    if wants_ndjson(request):
+        rows = SystemService.iter_systems(db=db, pagination=pagination, **filters, user_email=user.email)
+        return ndjson_response(rows, system_adapter)
+
+    return await SystemService.list_systems(db=db, pagination=pagination, **filters, user_email=user.email)
 
 
 @router.post(
@@ -98,15 +116,16 @@ async def create_system(
 
 @router.get(
     "/systems/{instance_id}",
-    response_model=SystemDetail,
+    responses={200: {"model": SystemDetail}, 304: {"description": "Not modified"}},
     summary="Get system details",
     description="Returns detailed information about a specific system including linked trials and change history.",
 )
 async def get_system(
     instance_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db_ro),
     user: User = Depends(require_viewer),
-) -> SystemDetail:
+) -> Response:
     """
     Get system by ID with linked trials and audit history.
 
@@ -114,16 +133,18 @@ async def get_system(
 
     Args:
         instance_id: System instance UUID
+        request: Incoming request (for If-None-Match)
         db: Database session
         user: Authenticated user
 
     Returns:
-        SystemDetail: System details with linked trials and audit history
+        SystemDetail JSON with an ETag, or 304 Not Modified
 
     Raises:
         404 Not Found: If system doesn't exist
     """
-    return await SystemService.get_system(db=db, instance_id=instance_id, user_email=user.email)
+    system = await SystemService.get_system(db=db, instance_id=instance_id, user_email=user.email)
+    return etag_response(request, system.model_dump_json().encode())
 
 
 @router.put(
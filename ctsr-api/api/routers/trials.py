@@ -4,12 +4,13 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.auth import User, UserRole, get_current_user, require_role
-from api.db.database import get_db
+from api.auth import User, require_trial_lead, require_viewer
+from api.db.database import get_db, get_db_ro
 from api.models.trials import (
+    LinkedSystemListResponse,
     SystemLinkCreate,
     SystemLinkResponse,
     SystemLinkUpdate,
@@ -18,8 +19,11 @@ from api.models.trials import (
     TrialListResponse,
     TrialResponse,
     TrialUpdate,
+    trial_adapter,
+    trial_list_adapter,
 )
 from api.services.trials import TrialService
+from api.utils.ndjson import NDJSON_RESPONSES, ndjson_response, wants_ndjson
 from api.utils.pagination import PaginationParams
 
 logger = logging.getLogger(__name__)
@@ -27,44 +31,54 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/trials", tags=["trials"])
 
 
-@router.get("", response_model=TrialListResponse, status_code=status.HTTP_200_OK)
+@router.get("", response_model=TrialListResponse, status_code=status.HTTP_200_OK, responses=NDJSON_RESPONSES)
 async def list_trials(
+    request: Request,
     search: Optional[str] = Query(None, description="Search in protocol number, title, or therapeutic area"),
     trial_status: Optional[str] = Query(None, description="Filter by trial status"),
     trial_phase: Optional[str] = Query(None, description="Filter by trial phase"),
     therapeutic_area: Optional[str] = Query(None, description="Filter by therapeutic area"),
     trial_lead_email: Optional[str] = Query(None, description="Filter by trial lead email"),
     pagination: PaginationParams = Depends(),
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.VIEWER)),
+    db: AsyncSession = Depends(get_db_ro),
+    user: User = Depends(require_viewer),
 ):
     """
     List all trials with optional search and filters.
 
+    With `Accept: application/x-ndjson` the page is streamed as one trial per
+    line, without pagination metadata.
+
     **Permissions:** VIEWER, TRIAL_LEAD, ADMIN
     """
-    trials, meta = await TrialService.list_trials(
-        db=db,
-        pagination=pagination,
+    filters = dict(
         search=search,
         trial_status=trial_status,
         trial_phase=trial_phase,
         therapeutic_area=therapeutic_area,
         trial_lead_email=trial_lead_email,
-        user_email=user.email,
     )
+    if wants_ndjson(request):
+        rows = TrialService.iter_trials(db=db, pagination=pagination, **filters, user_email=user.email)
+        return ndjson_response(rows, trial_adapter)
+
+    trials, meta = await TrialService.list_trials(db=db, pagination=pagination, **filters, user_email=user.email)
 
     return TrialListResponse(
-        data=[TrialResponse.model_validate(trial) for trial in trials],
-        meta=meta.model_dump(),
+        data=trial_list_adapter.validate_python(trials),
+        meta=meta,
     )
 
 
-@router.post("", response_model=TrialResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=TrialResponse,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_trial(
     trial_data: TrialCreate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Create a new trial.
@@ -77,8 +91,8 @@ async def create_trial(
 @router.get("/{trial_id}", response_model=TrialDetail, status_code=status.HTTP_200_OK)
 async def get_trial(
     trial_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.VIEWER)),
+    db: AsyncSession = Depends(get_db_ro),
+    user: User = Depends(require_viewer),
 ):
     """
     Get trial details including linked systems.
@@ -88,12 +102,16 @@ async def get_trial(
     return await TrialService.get_trial(db=db, trial_id=trial_id, user_email=user.email)
 
 
-@router.put("/{trial_id}", response_model=TrialResponse, status_code=status.HTTP_200_OK)
+@router.put(
+    "/{trial_id}",
+    response_model=TrialResponse,
+    status_code=status.HTTP_200_OK,
+)
 async def update_trial(
     trial_id: UUID,
     trial_data: TrialUpdate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Update a trial.
@@ -103,19 +121,19 @@ async def update_trial(
     return await TrialService.update_trial(db=db, trial_id=trial_id, trial_data=trial_data, user_email=user.email)
 
 
-@router.get("/{trial_id}/systems", status_code=status.HTTP_200_OK)
+@router.get("/{trial_id}/systems", response_model=LinkedSystemListResponse, status_code=status.HTTP_200_OK)
 async def get_trial_systems(
     trial_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.VIEWER)),
-):
+    db: AsyncSession = Depends(get_db_ro),
+    user: User = Depends(require_viewer),
+) -> LinkedSystemListResponse:
     """
     Get all systems linked to a trial.
 
     **Permissions:** VIEWER, TRIAL_LEAD, ADMIN
     """
     trial = await TrialService.get_trial(db=db, trial_id=trial_id, user_email=user.email)
-    return {"data": trial.linked_systems}
+    return LinkedSystemListResponse(data=trial.linked_systems)
 
 
 @router.post(
@@ -127,7 +145,7 @@ async def link_system_to_trial(
     trial_id: UUID,
     link_data: SystemLinkCreate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Link a system to a trial with criticality assignment.
@@ -147,7 +165,7 @@ async def update_system_link(
     instance_id: UUID,
     link_data: SystemLinkUpdate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
+    user: User = Depends(require_trial_lead),
 ):
     """
     Update a trial-system link (e.g., change criticality).
@@ -171,12 +189,12 @@ async def unlink_system_from_trial(
     trial_id: UUID,
     instance_id: UUID,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role(UserRole.TRIAL_LEAD)),
-):
+    user: User = Depends(require_trial_lead),
+) -> Response:
     """
     Unlink a system from a trial (soft delete).
 
     **Permissions:** TRIAL_LEAD, ADMIN
     """
     await TrialService.unlink_system(db=db, trial_id=trial_id, instance_id=instance_id, user_email=user.email)
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
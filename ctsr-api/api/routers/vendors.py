@@ -1,39 +1,51 @@
 """Vendor management endpoints."""
 
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.auth import User, require_admin, require_viewer
-from api.db import get_db
+from api.db import get_db, get_db_ro
 from api.models.vendors import VendorCreate, VendorListResponse, VendorResponse, VendorUpdate
 from api.services.vendors import VendorService
+from api.utils.etag import etag_for, etag_response, not_modified
 from api.utils.pagination import PaginationParams
 
 router = APIRouter()
 
+# The unfiltered vendor list is reference data. "private" because the endpoint
+# requires authentication, so shared caches must not serve it to other clients.
+VENDOR_LIST_CACHE_CONTROL = "private, max-age=60, stale-while-revalidate=300"
+
 
 @router.get(
     "/vendors",
     response_model=VendorListResponse,
     summary="List vendors",
     description="Returns a paginated list of vendors with optional filtering by type and active status.",
+    responses={304: {"description": "Not modified"}},
 )
 async def list_vendors(
+    request: Request,
     vendor_type: Optional[str] = Query(None, description="Filter by vendor type"),
     is_active: bool = Query(True, description="Filter by active status"),
     pagination: PaginationParams = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
     user: User = Depends(require_viewer),
-) -> VendorListResponse:
+) -> Union[VendorListResponse, Response]:
     """
     List all vendors with pagination.
 
     Requires CTSR_VIEWER role or higher.
 
+    Without filters the list carries Cache-Control and an ETag derived from the
+    vendor table's version, so a matching If-None-Match is answered with 304
+    before the list is queried.
+
     Args:
+        request: Incoming request (for If-None-Match)
         vendor_type: Optional filter by vendor type
         is_active: Filter by active status (default: true)
         pagination: Pagination parameters
@@ -41,15 +53,26 @@ async def list_vendors(
         user: Authenticated user
 
     Returns:
-        VendorListResponse: Paginated list of vendors
+        VendorListResponse: Paginated list of vendors (or 304 Not Modified)
     """
-    return await VendorService.list_vendors(
+    unfiltered = vendor_type is None and is_active
+    if unfiltered:
+        headers = {"Cache-Control": VENDOR_LIST_CACHE_CONTROL}
+        etag = etag_for((await VendorService.get_list_version(db)).encode())
+        response = not_modified(request, etag, headers)
+        if response is not None:
+            return response
+
+    vendors = await VendorService.list_vendors(
         db=db,
         pagination=pagination,
         vendor_type=vendor_type,
         is_active=is_active,
         user_email=user.email,
     )
+    if unfiltered:
+        return etag_response(request, vendors.model_dump_json().encode(), etag=etag, headers=headers)
+    return vendors
 
 
 @router.post(
@@ -86,15 +109,16 @@ async def create_vendor(
 
 @router.get(
     "/vendors/{vendor_id}",
-    response_model=VendorResponse,
+    responses={200: {"model": VendorResponse}, 304: {"description": "Not modified"}},
     summary="Get vendor details",
     description="Returns detailed information about a specific vendor.",
 )
 async def get_vendor(
     vendor_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db_ro),
     user: User = Depends(require_viewer),
-) -> VendorResponse:
+) -> Response:
     """
     Get vendor by ID.
 
@@ -102,16 +126,18 @@ async def get_vendor(
 
     Args:
         vendor_id: Vendor UUID
+        request: Incoming request (for If-None-Match)
         db: Database session
         user: Authenticated user
 
     Returns:
-        VendorResponse: Vendor details
+        VendorResponse JSON with an ETag, or 304 Not Modified
 
     Raises:
         404 Not Found: If vendor doesn't exist
     """
-    return await VendorService.get_vendor(db=db, vendor_id=vendor_id, user_email=user.email)
+    vendor = await VendorService.get_vendor(db=db, vendor_id=vendor_id, user_email=user.email)
+    return etag_response(request, vendor.model_dump_json().encode())
 
 
 @router.put(
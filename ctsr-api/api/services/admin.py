@@ -4,20 +4,41 @@ Admin Service
 Business logic for admin dashboard statistics and aggregations.
 """
 
-from datetime import datetime, timedelta
-
-from sqlalchemy import and_, case, func, or_, select
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Select,
+    String,
+    Subquery,
+    and_,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
-from api.db.models import Confirmation, SystemInstance, Trial, TrialSystemLink, ValidationStatus
-from api.models.admin import (
-    ConfirmationSummary,
-    DashboardStats,
-    RecentActivity,
-    SystemSummary,
-    TrialSummary,
-    ValidationAlertSummary,
-)
+from api.db.models import Confirmation, SystemInstance, Trial, TrialSystemLink
+from api.utils.sql import json_object
+
+# Trials no longer counted as open
+CLOSED_TRIAL_STATUSES = ("CLOSED", "CANCELLED")
+
+# Active systems still waiting for validation
+UNVALIDATED_STATUSES = ("NOT_VALIDATED", "PENDING_VALIDATION")
+
+
+def _text(value: str) -> ColumnElement:
+    """SQL string literal (not a bind parameter, so the server can infer its type)."""
+    return literal_column(f"'{value}'", String)
 
 
 class AdminService:
@@ -26,243 +47,258 @@ class AdminService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_dashboard_stats(self) -> DashboardStats:
+    async def get_dashboard_version(self) -> str:
         """
-        Get comprehensive dashboard statistics.
+        Get a cheap version stamp of the rows the dashboard is built from.
+
+        Changes whenever a trial, system, link or confirmation is created, updated or
+        deleted, whichever process made the change, so the cached dashboard can be
+        checked against it instead of being rebuilt.
 
         Returns:
-            DashboardStats with aggregated counts and recent activities
+            str: Row counts and latest change markers of the dashboard tables
         """
-        # Get trial statistics
-        trial_stats = await self._get_trial_stats()
-
-        # Get system statistics
-        system_stats = await self._get_system_stats()
+        result = await self.db.execute(self._dashboard_version_query())
+        return ":".join(str(value) for value in result.one())
 
-        # Get confirmation statistics
-        confirmation_stats = await self._get_confirmation_stats()
+    async def get_dashboard_json(self) -> bytes:
+        """
+        Get comprehensive dashboard statistics as a serialized JSON document.
 
-        # Get validation alert statistics
-        alert_stats = await self._get_alert_stats()
+        The document is built by PostgreSQL in the shape of
+        :class:`api.models.admin.DashboardStats`, so no Pydantic models are
+        constructed or validated for this read-only view.
 
-        # Get recent activities
-        recent_activities = await self._get_recent_activities()
+        Returns:
+            UTF-8 encoded DashboardStats JSON
+        """
+        today = datetime.utcnow().date()
+        params = {"today": today, "first_of_month": today.replace(day=1)}
+        document = await self.db.scalar(self._dashboard_query(), params)
+        return document.encode()
 
-        return DashboardStats(
-            trials=trial_stats,
-            systems=system_stats,
-            confirmations=confirmation_stats,
-            validation_alerts=alert_stats,
-            recent_activities=recent_activities,
-            generated_at=datetime.utcnow(),
-        )
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _dashboard_version_query() -> Select:
+        """
+        Build one statement returning the version stamp columns of the dashboard tables.
 
-    async def _get_trial_stats(self) -> TrialSummary:
-        """Get trial summary statistics."""
-        # Total trials (excluding closed/cancelled)
-        total_result = await self.db.execute(
-            select(func.count(Trial.trial_id)).where(Trial.trial_status.notin_(["CLOSED", "CANCELLED"]))
-        )
-        total_trials = total_result.scalar() or 0
+        Confirmations have no update timestamp; the only columns the dashboard reads
+        that can change in place are the status, confirmed date and due date, so
+        those are summarized instead.
+        """
+        tables = [
+            select(func.count(), func.max(model.updated_at)).subquery(f"{model.__tablename__}_changes")
+            for model in (Trial, SystemInstance, TrialSystemLink)
+        ]
+        confirmations = select(
+            func.count(),
+            func.max(Confirmation.created_at),
+            func.count().filter(Confirmation.confirmation_status == "COMPLETED"),
+            func.max(Confirmation.confirmed_date),
+            func.sum(Confirmation.due_date - literal_column("DATE '2000-01-01'", Date)),
+        ).subquery("confirmations_changes")
+        tables.append(confirmations)
+
+        # Every subquery is a single row, so they are simply joined side by side
+        single_row = tables[0]
+        for table in tables[1:]:
+            single_row = single_row.join(table, true())
+        return select(*[column for table in tables for column in table.c]).select_from(single_row)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _dashboard_query(activity_limit: int = 10) -> Select:
+        """
+        Build one statement returning the whole dashboard as JSON text.
 
-        # Active trials (trials with active systems)
-        active_result = await self.db.execute(
-            select(func.count(func.distinct(TrialSystemLink.trial_id)))
-            .join(SystemInstance, TrialSystemLink.instance_id == SystemInstance.instance_id)
-            .where(and_(SystemInstance.is_active == True, TrialSystemLink.assignment_status == "ACTIVE"))
-        )
-        active_trials = active_result.scalar() or 0
+        Each table is aggregated in its own CTE using FILTER aggregates; the
+        single-row CTEs are then cross joined and assembled with json_build_object.
 
-        # Trials with validation alerts (feature not yet implemented)
-        trials_with_alerts = 0
+        The statement takes the current date as the "today" and "first_of_month"
+        bind parameters, so it is built (and its SQL cache key computed) only once.
+        """
+        today = bindparam("today")
+        first_of_month = bindparam("first_of_month")
 
-        return TrialSummary(
-            total_trials=total_trials, active_trials=active_trials, trials_with_alerts=trials_with_alerts
+        # Active links on active systems
+        active_links = and_(TrialSystemLink.assignment_status == "ACTIVE", SystemInstance.is_active == True)
+        trials_with_active_links = (
+            select(TrialSystemLink.trial_id)
+            .join(SystemInstance, TrialSystemLink.instance_id == SystemInstance.instance_id)
+            .where(active_links)
         )
 
-    async def _get_system_stats(self) -> SystemSummary:
-        """Get system summary statistics."""
-        # Total systems
-        total_result = await self.db.execute(select(func.count(SystemInstance.instance_id)))
-        total_systems = total_result.scalar() or 0
-
-        # Active systems
-        active_result = await self.db.execute(
-            select(func.count(SystemInstance.instance_id)).where(SystemInstance.is_active == True)
+        # Trials: open ones (excluding closed/cancelled), and those with active systems. The IN
+        # subquery is uncorrelated, so it is hashed once instead of de-duplicating link rows
+        trial_counts = select(
+            func.count().filter(Trial.trial_status.notin_(CLOSED_TRIAL_STATUSES)).label("total_trials"),
+            func.count().filter(Trial.trial_id.in_(trials_with_active_links)).label("active_trials"),
         )
-        active_systems = active_result.scalar() or 0
 
-        # Validated systems
-        validated_result = await self.db.execute(
-            select(func.count(SystemInstance.instance_id)).where(
-                and_(SystemInstance.is_active == True, SystemInstance.validation_status_code == "VALIDATED")
+        # Active links by criticality
+        link_counts = (
+            select(
+                func.count().filter(TrialSystemLink.criticality_code == "CRIT").label("crit_links"),
+                func.count().filter(TrialSystemLink.criticality_code == "MAJ").label("maj_links"),
+                func.count().filter(TrialSystemLink.criticality_code == "STD").label("std_links"),
             )
+            .join(SystemInstance, TrialSystemLink.instance_id == SystemInstance.instance_id)
+            .where(active_links)
         )
-        validated_systems = validated_result.scalar() or 0
 
-        # Systems needing validation
-        needing_validation_result = await self.db.execute(
-            select(func.count(SystemInstance.instance_id)).where(
+        system_counts = select(
+            func.count().label("total_systems"),
+            func.count().filter(SystemInstance.is_active == True).label("active_systems"),
+            func.count()
+            .filter(and_(SystemInstance.is_active == True, SystemInstance.validation_status_code == "VALIDATED"))
+            .label("validated_systems"),
+            func.count()
+            .filter(
                 and_(
                     SystemInstance.is_active == True,
-                    or_(
-                        SystemInstance.validation_status_code == "NOT_VALIDATED",
-                        SystemInstance.validation_status_code == "PENDING_VALIDATION",
-                    ),
+                    SystemInstance.validation_status_code.in_(UNVALIDATED_STATUSES),
                 )
             )
+            .label("systems_needing_validation"),
         )
-        systems_needing_validation = needing_validation_result.scalar() or 0
 
-        # Systems by criticality
-        criticality_result = await self.db.execute(
-            select(TrialSystemLink.criticality_code, func.count(TrialSystemLink.link_id))
-            .join(SystemInstance, TrialSystemLink.instance_id == SystemInstance.instance_id)
-            .where(and_(TrialSystemLink.assignment_status == "ACTIVE", SystemInstance.is_active == True))
-            .group_by(TrialSystemLink.criticality_code)
-        )
-        systems_by_criticality = {row[0]: row[1] for row in criticality_result.all()}
-
-        return SystemSummary(
-            total_systems=total_systems,
-            active_systems=active_systems,
-            validated_systems=validated_systems,
-            systems_needing_validation=systems_needing_validation,
-            systems_by_criticality=systems_by_criticality,
-        )
-
-    async def _get_confirmation_stats(self) -> ConfirmationSummary:
-        """Get confirmation summary statistics."""
-        # Total confirmations
-        total_result = await self.db.execute(select(func.count(Confirmation.confirmation_id)))
-        total_confirmations = total_result.scalar() or 0
-
-        # Pending confirmations
-        pending_result = await self.db.execute(
-            select(func.count(Confirmation.confirmation_id)).where(Confirmation.confirmation_status == "PENDING")
-        )
-        pending_confirmations = pending_result.scalar() or 0
-
-        # Overdue confirmations
-        today = datetime.utcnow().date()
-        overdue_result = await self.db.execute(
-            select(func.count(Confirmation.confirmation_id)).where(
-                and_(Confirmation.confirmation_status == "PENDING", Confirmation.due_date < today)
+        confirmation_counts = select(
+            func.count().label("total_confirmations"),
+            func.count().filter(Confirmation.confirmation_status == "PENDING").label("pending_confirmations"),
+            func.count()
+            .filter(and_(Confirmation.confirmation_status == "PENDING", Confirmation.due_date < today))
+            .label("overdue_confirmations"),
+            func.count()
+            .filter(
+                and_(Confirmation.confirmation_status == "COMPLETED", Confirmation.confirmed_date >= first_of_month)
             )
+            .label("completed_this_month"),
         )
-        overdue_confirmations = overdue_result.scalar() or 0
 
-        # Completed this month
-        first_of_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        completed_result = await self.db.execute(
-            select(func.count(Confirmation.confirmation_id)).where(
-                and_(Confirmation.confirmation_status == "COMPLETED", Confirmation.confirmed_date >= first_of_month)
+        trials = trial_counts.cte("trial_counts")
+        links = link_counts.cte("link_counts")
+        systems = system_counts.cte("system_counts")
+        confirmations = confirmation_counts.cte("confirmation_counts")
+
+        recent = AdminService._recent_activities_subquery(activity_limit)
+        recent_activities = (
+            select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(recent.table_valued(), recent.c.performed_at.desc())),
+                    literal_column("'[]'::json"),
+                )
             )
+            .select_from(recent)
+            .scalar_subquery()
         )
-        completed_this_month = completed_result.scalar() or 0
 
-        return ConfirmationSummary(
-            total_confirmations=total_confirmations,
-            pending_confirmations=pending_confirmations,
-            overdue_confirmations=overdue_confirmations,
-            completed_this_month=completed_this_month,
+        document = json_object(
+            trials=json_object(
+                total_trials=trials.c.total_trials,
+                active_trials=trials.c.active_trials,
+                # Trials with validation alerts (feature not yet implemented)
+                trials_with_alerts=literal_column("0"),
+            ),
+            systems=json_object(
+                total_systems=systems.c.total_systems,
+                active_systems=systems.c.active_systems,
+                validated_systems=systems.c.validated_systems,
+                systems_needing_validation=systems.c.systems_needing_validation,
+                systems_by_criticality=json_object(
+                    CRIT=links.c.crit_links, MAJ=links.c.maj_links, STD=links.c.std_links
+                ),
+            ),
+            confirmations=json_object(
+                total_confirmations=confirmations.c.total_confirmations,
+                pending_confirmations=confirmations.c.pending_confirmations,
+                overdue_confirmations=confirmations.c.overdue_confirmations,
+                completed_this_month=confirmations.c.completed_this_month,
+            ),
+            # ValidationAlert feature not yet implemented - return zeros
+            validation_alerts=json_object(
+                total_alerts=literal_column("0"),
+                open_alerts=literal_column("0"),
+                critical_alerts=literal_column("0"),
+                alerts_by_type=literal_column("'{}'::json"),
+            ),
+            recent_activities=recent_activities,
+            generated_at=func.timezone("UTC", func.now()),
         )
+        # Every CTE is a single row, so they are simply joined side by side
+        single_row = trials.join(links, true()).join(systems, true()).join(confirmations, true())
+        return select(cast(document, String)).select_from(single_row)
 
-    async def _get_alert_stats(self) -> ValidationAlertSummary:
-        """Get validation alert summary statistics."""
-        # ValidationAlert feature not yet implemented - return zeros
-        return ValidationAlertSummary(total_alerts=0, open_alerts=0, critical_alerts=0, alerts_by_type={})
-
-    async def _get_recent_activities(self, limit: int = 10) -> list[RecentActivity]:
+    @staticmethod
+    def _recent_activities_subquery(limit: int) -> Subquery:
         """
-        Get recent activities across the system.
+        Build the most recent trial creations, system additions and confirmation
+        submissions as one subquery shaped like RecentActivity.
 
         Args:
             limit: Maximum number of activities to return
 
         Returns:
-            List of recent activities
+            Subquery of at most ``limit`` activity rows
         """
-        activities = []
-
-        # Get recent trial creations
-        trial_result = await self.db.execute(
-            select(Trial.trial_id, Trial.protocol_number, Trial.created_at)
-            .where(Trial.trial_status.notin_(["CLOSED", "CANCELLED"]))
+        # Recent trial creations
+        trial_activities = (
+            select(
+                _text("TRIAL_CREATED").label("activity_type"),
+                cast(Trial.trial_id, String).label("entity_id"),
+                Trial.protocol_number.label("entity_name"),
+                _text("system").label("performed_by"),
+                Trial.created_at.label("performed_at"),
+                ("Trial " + Trial.protocol_number + " created").label("details"),
+            )
+            .where(Trial.trial_status.notin_(CLOSED_TRIAL_STATUSES))
             .order_by(Trial.created_at.desc())
             .limit(limit)
         )
-        for row in trial_result.all():
-            # Ensure datetime is naive
-            performed_at = row.created_at.replace(tzinfo=None) if row.created_at.tzinfo else row.created_at
-            activities.append(
-                RecentActivity(
-                    activity_type="TRIAL_CREATED",
-                    entity_id=str(row.trial_id),
-                    entity_name=row.protocol_number,
-                    performed_by="system",
-                    performed_at=performed_at,
-                    details=f"Trial {row.protocol_number} created",
-                )
-            )
 
-        # Get recent system additions
-        system_result = await self.db.execute(
+        # Recent system additions
+        system_activities = (
             select(
-                SystemInstance.instance_id,
-                SystemInstance.instance_code,
-                SystemInstance.platform_name,
-                SystemInstance.created_by,
-                SystemInstance.created_at,
+                _text("SYSTEM_ADDED").label("activity_type"),
+                cast(SystemInstance.instance_id, String).label("entity_id"),
+                (SystemInstance.instance_code + " - " + SystemInstance.platform_name).label("entity_name"),
+                func.coalesce(SystemInstance.created_by, "system").label("performed_by"),
+                SystemInstance.created_at.label("performed_at"),
+                ("System " + SystemInstance.instance_code + " added").label("details"),
             )
             .where(SystemInstance.is_active == True)
             .order_by(SystemInstance.created_at.desc())
             .limit(limit)
         )
-        for row in system_result.all():
-            # Ensure datetime is naive
-            performed_at = row.created_at.replace(tzinfo=None) if row.created_at.tzinfo else row.created_at
-            activities.append(
-                RecentActivity(
-                    activity_type="SYSTEM_ADDED",
-                    entity_id=str(row.instance_id),
-                    entity_name=f"{row.instance_code} - {row.platform_name}",
-                    performed_by=row.created_by or "system",
-                    performed_at=performed_at,
-                    details=f"System {row.instance_code} added",
-                )
-            )
 
-        # Get recent confirmation submissions
-        confirmation_result = await self.db.execute(
+        # Recent confirmation submissions (dates reported as midnight)
+        confirmation_activities = (
             select(
-                Confirmation.confirmation_id,
-                Confirmation.confirmation_type,
-                Confirmation.confirmed_by,
-                Confirmation.confirmed_date,
-                Trial.protocol_number,
+                _text("CONFIRMATION_SUBMITTED").label("activity_type"),
+                cast(Confirmation.confirmation_id, String).label("entity_id"),
+                (Confirmation.confirmation_type + " - " + Trial.protocol_number).label("entity_name"),
+                func.coalesce(Confirmation.confirmed_by, "system").label("performed_by"),
+                func.coalesce(cast(Confirmation.confirmed_date, DateTime), func.timezone("UTC", func.now())).label(
+                    "performed_at"
+                ),
+                (Confirmation.confirmation_type + " confirmation submitted for " + Trial.protocol_number).label(
+                    "details"
+                ),
             )
             .join(Trial, Confirmation.trial_id == Trial.trial_id)
             .where(Confirmation.confirmation_status == "COMPLETED")
             .order_by(Confirmation.confirmed_date.desc())
             .limit(limit)
         )
-        for row in confirmation_result.all():
-            # Convert date to datetime for sorting
-            performed_at = (
-                datetime.combine(row.confirmed_date, datetime.min.time()) if row.confirmed_date else datetime.utcnow()
-            )
-            activities.append(
-                RecentActivity(
-                    activity_type="CONFIRMATION_SUBMITTED",
-                    entity_id=str(row.confirmation_id),
-                    entity_name=f"{row.confirmation_type} - {row.protocol_number}",
-                    performed_by=row.confirmed_by or "system",
-                    performed_at=performed_at,
-                    details=f"{row.confirmation_type} confirmation submitted for {row.protocol_number}",
-                )
-            )
 
-        # Sort all activities by date and return top N
-        activities.sort(key=lambda x: x.performed_at, reverse=True)
-        return activities[:limit]
+        activities = union_all(
+            *[
+                select(source)
+                for source in (
+                    trial_activities.subquery(),
+                    system_activities.subquery(),
+                    confirmation_activities.subquery(),
+                )
+            ]
+        ).subquery("activities")
+        return select(activities).order_by(activities.c.performed_at.desc()).limit(limit).subquery("recent")
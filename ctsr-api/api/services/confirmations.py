@@ -1,13 +1,16 @@
 """Service layer for confirmation management."""
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Integer, Select, and_, bindparam, func, insert, literal, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.elements import ColumnElement
 
 from api.db.models import Confirmation, LinkSnapshot, SystemInstance, Trial, TrialSystemLink
 from api.exceptions import ConflictError, NotFoundError, ValidationError
@@ -19,12 +22,16 @@ from api.models.confirmations import (
     ConfirmationUpdate,
     ExportRequest,
     ExportResponse,
-    SystemSnapshotSummary,
 )
-from api.utils.pagination import PaginationMeta, PaginationParams
+from api.utils.pagination import PaginationMeta, PaginationParams, decode_cursor, encode_cursor
+from api.utils.rows import as_dicts, response_columns, stream_dicts
+from api.utils.sql import jsonb_object
 
 logger = logging.getLogger(__name__)
 
+# Validation statuses that raise an alert on a submitted confirmation
+ALERT_VALIDATION_STATUSES = ("VAL_EXPIRED", "NOT_VALIDATED")
+
 
 class ConfirmationService:
     """Service for managing confirmations and exports."""
@@ -38,47 +45,182 @@ class ConfirmationService:
         confirmation_type: Optional[str] = None,
         overdue_only: bool = False,
         user_email: str = "system",
-    ) -> tuple[List[Confirmation], PaginationMeta]:
+    ) -> tuple[List[Dict[str, Any]], PaginationMeta]:
         """List confirmations with optional filters."""
         logger.info(
             f"Listing confirmations - user: {user_email}, trial: {trial_id}, "
             f"status: {confirmation_status}, overdue: {overdue_only}"
         )
 
-        # Build base query
-        query = select(Confirmation)
-
-        # Apply filters
-        if trial_id:
-            query = query.where(Confirmation.trial_id == trial_id)
-        if confirmation_status:
-            query = query.where(Confirmation.confirmation_status == confirmation_status)
-        if confirmation_type:
-            query = query.where(Confirmation.confirmation_type == confirmation_type)
-        if overdue_only:
-            query = query.where(
+        params = ConfirmationService._filter_params(trial_id, confirmation_status, confirmation_type, overdue_only)
+        filters = frozenset(params)
+
+        # Fetch one extra row to tell whether there is a next page; offset pages
+        # also carry the total count (not computed when paging by cursor)
+        page_query, page_params = ConfirmationService._page(filters, pagination, pagination.limit + 1, with_total=True)
+        result = await db.execute(page_query, {**params, **page_params})
+        confirmations = as_dicts(result)
+
+        total = None
+        if not pagination.cursor:
+            for confirmation in confirmations:
+                total = confirmation.pop("total")
+            if total is None:
+                # No rows on this page: the window saw nothing, so count unless the list is empty
+                total = 0
+                if pagination.offset:
+                    total_result = await db.execute(ConfirmationService._count_query(filters), params)
+                    total = total_result.scalar_one()
+
+        next_cursor = None
+        if len(confirmations) > pagination.limit:
+            del confirmations[pagination.limit :]
+            last = confirmations[-1]
+            next_cursor = encode_cursor(last["due_date"], last["confirmation_id"])
+
+        logger.info(f"Found {total} confirmations, returning {len(confirmations)} items")
+
+        return confirmations, PaginationMeta(
+            total=total,
+            limit=pagination.limit,
+            offset=0 if pagination.cursor else pagination.offset,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def iter_confirmations(
+        db: AsyncSession,
+        pagination: PaginationParams,
+        trial_id: Optional[UUID] = None,
+        confirmation_status: Optional[str] = None,
+        confirmation_type: Optional[str] = None,
+        overdue_only: bool = False,
+        user_email: str = "system",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a page of confirmations from a server-side cursor.
+
+        Same filters, ordering and page as list_confirmations, without the total count.
+
+        Not a generator itself: the cursor is decoded (and a malformed one rejected)
+        when this is called, before a streaming response has started.
+        """
+        logger.info(
+            f"Streaming confirmations - user: {user_email}, trial: {trial_id}, "
+            f"status: {confirmation_status}, overdue: {overdue_only}"
+        )
+
+        params = ConfirmationService._filter_params(trial_id, confirmation_status, confirmation_type, overdue_only)
+        page_query, page_params = ConfirmationService._page(frozenset(params), pagination, pagination.limit)
+
+        return stream_dicts(db, page_query, {**params, **page_params})
+
+    @staticmethod
+    def _filter_params(
+        trial_id: Optional[UUID],
+        confirmation_status: Optional[str],
+        confirmation_type: Optional[str],
+        overdue_only: bool,
+    ) -> Dict[str, Any]:
+        """Bind values of the list filters that are set, keyed by bind parameter name."""
+        params = {
+            "trial_id": trial_id,
+            "confirmation_status": confirmation_status,
+            "confirmation_type": confirmation_type,
+            "overdue_before": datetime.utcnow().date() if overdue_only else None,
+        }
+        return {name: value for name, value in params.items() if value}
+
+    @staticmethod
+    def _filter_clauses(filters: frozenset[str]) -> List[ColumnElement]:
+        """WHERE clauses for a combination of list filters, with values left as bind parameters."""
+        clauses = []
+        if "trial_id" in filters:
+            clauses.append(Confirmation.trial_id == bindparam("trial_id"))
+        if "confirmation_status" in filters:
+            clauses.append(Confirmation.confirmation_status == bindparam("confirmation_status"))
+        if "confirmation_type" in filters:
+            clauses.append(Confirmation.confirmation_type == bindparam("confirmation_type"))
+        if "overdue_before" in filters:
+            clauses.append(
                 and_(
                     Confirmation.confirmation_status == "PENDING",
-                    Confirmation.due_date < datetime.utcnow().date(),
+                    Confirmation.due_date < bindparam("overdue_before"),
                 )
             )
+        return clauses
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply ordering and pagination
-        query = query.order_by(Confirmation.due_date.desc())
-        query = query.limit(pagination.limit).offset(pagination.offset)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _list_query(filters: frozenset[str]) -> Select:
+        """
+        Build the filtered confirmation list query (plain columns; rows are validated as dicts).
+
+        Filter values are bound at execution time, so the statement is built and
+        its SQL cache key computed once per combination of filters.
+        """
+        return select(*response_columns(Confirmation, ConfirmationResponse)).where(
+            *ConfirmationService._filter_clauses(filters)
+        )
 
-        # Execute query
-        result = await db.execute(query)
-        confirmations = result.scalars().all()
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _count_query(filters: frozenset[str]) -> Select:
+        """Count the rows matching a combination of list filters directly on the table."""
+        return select(func.count()).select_from(Confirmation).where(*ConfirmationService._filter_clauses(filters))
 
-        logger.info(f"Found {total} confirmations, returning {len(confirmations)} items")
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _page_query(filters: frozenset[str], seek: Optional[str], with_total: bool = False) -> Select:
+        """
+        Order the filtered list query and restrict it to one page.
+
+        Args:
+            filters: Names of the filters that are set
+            seek: None to page by offset; "dated" or "undated" to page after a cursor
+                whose due date is set or empty
+            with_total: Add a "total" column holding the number of matching rows
+                (COUNT(*) OVER () is evaluated before LIMIT/OFFSET)
+        """
+        query = ConfirmationService._list_query(filters)
+        if with_total:
+            query = query.add_columns(func.count().over().label("total"))
+        after_id = bindparam("after_id")
+        if seek == "undated":
+            # Undated confirmations sort first; after them come the rest of those, then all dated ones
+            query = query.where(or_(Confirmation.due_date.is_not(None), Confirmation.confirmation_id < after_id))
+        elif seek == "dated":
+            after_due = bindparam("after_due")
+            query = query.where(
+                or_(
+                    Confirmation.due_date < after_due,
+                    and_(Confirmation.due_date == after_due, Confirmation.confirmation_id < after_id),
+                )
+            )
+        else:
+            query = query.offset(bindparam("offset", type_=Integer))
+        # confirmation_id breaks ties so every row has a stable position across pages
+        return query.order_by(Confirmation.due_date.desc().nulls_first(), Confirmation.confirmation_id.desc()).limit(
+            bindparam("limit", type_=Integer)
+        )
 
-        return list(confirmations), PaginationMeta(total=total, limit=pagination.limit, offset=pagination.offset)
+    @staticmethod
+    def _page(
+        filters: frozenset[str], pagination: PaginationParams, limit: int, with_total: bool = False
+    ) -> tuple[Select, Dict[str, Any]]:
+        """
+        Pick the page statement for the pagination mode, with its bind values.
+
+        with_total only applies to offset pages; cursor pages never report a total.
+        """
+        if pagination.cursor:
+            after_due, after_id = decode_cursor(pagination.cursor, date.fromisoformat, UUID)
+            if after_due is None:
+                return ConfirmationService._page_query(filters, "undated"), {"limit": limit, "after_id": after_id}
+            page_params = {"limit": limit, "after_due": after_due, "after_id": after_id}
+            return ConfirmationService._page_query(filters, "dated"), page_params
+        page_params = {"limit": limit, "offset": pagination.offset}
+        return ConfirmationService._page_query(filters, None, with_total), page_params
 
     @staticmethod
     async def create_confirmation(
@@ -94,15 +236,11 @@ class ConfirmationService:
             raise NotFoundError("Trial", confirmation_data.trial_id)
 
         # Count active systems for this trial
-        systems_count_query = select(func.count()).select_from(
-            select(TrialSystemLink)
-            .where(
-                and_(
-                    TrialSystemLink.trial_id == confirmation_data.trial_id,
-                    TrialSystemLink.unlinked_at.is_(None),
-                )
+        systems_count_query = select(func.count(TrialSystemLink.link_id)).where(
+            and_(
+                TrialSystemLink.trial_id == confirmation_data.trial_id,
+                TrialSystemLink.unlinked_at.is_(None),
             )
-            .subquery()
         )
         systems_count_result = await db.execute(systems_count_query)
         systems_count = systems_count_result.scalar_one()
@@ -119,7 +257,6 @@ class ConfirmationService:
         try:
             db.add(confirmation)
             await db.commit()
-            await db.refresh(confirmation)
             logger.info(f"Confirmation created: {confirmation.confirmation_id}")
             return ConfirmationResponse.model_validate(confirmation)
         except IntegrityError as e:
@@ -132,58 +269,33 @@ class ConfirmationService:
         """Get confirmation details with snapshots."""
         logger.info(f"Fetching confirmation {confirmation_id} for user {user_email}")
 
-        # Get confirmation with trial info
-        confirmation_query = (
-            select(Confirmation, Trial.protocol_number)
-            .join(Trial, Confirmation.trial_id == Trial.trial_id)
-            .where(Confirmation.confirmation_id == confirmation_id)
+        confirmation_result = await db.execute(
+            ConfirmationService._detail_query(), {"confirmation_id": confirmation_id}
         )
-        confirmation_result = await db.execute(confirmation_query)
-        result_row = confirmation_result.first()
+        confirmation = confirmation_result.unique().scalar_one_or_none()
 
-        if not result_row:
+        if not confirmation:
             raise NotFoundError("Confirmation", confirmation_id)
 
-        confirmation, protocol_number = result_row
-
-        # Get snapshots
-        snapshots_query = (
-            select(
-                LinkSnapshot,
-                SystemInstance.instance_code,
-                SystemInstance.platform_name,
-            )
-            .join(
-                SystemInstance,
-                LinkSnapshot.instance_id == SystemInstance.instance_id,
-            )
-            .where(LinkSnapshot.confirmation_id == confirmation_id)
-            .order_by(LinkSnapshot.created_at.desc())
-        )
-
-        snapshots_result = await db.execute(snapshots_query)
-        snapshots_data = snapshots_result.all()
-
-        # Build snapshots list
-        snapshots = []
-        for snapshot, instance_code, platform_name in snapshots_data:
-            snapshots.append(
-                SystemSnapshotSummary(
-                    snapshot_id=snapshot.snapshot_id,
-                    instance_id=snapshot.instance_id,
-                    instance_code=instance_code,
-                    platform_name=platform_name,
-                    validation_status_at=snapshot.validation_status_at,
-                    platform_version_at=snapshot.platform_version_at,
-                    created_at=snapshot.created_at,
-                )
-            )
+        # Build snapshots list (newest first) as dicts; they are validated together with the detail
+        snapshots = [
+            {
+                "snapshot_id": snapshot.snapshot_id,
+                "instance_id": snapshot.instance_id,
+                "instance_code": snapshot.system_instance.instance_code,
+                "platform_name": snapshot.system_instance.platform_name,
+                "validation_status_at": snapshot.validation_status_at,
+                "platform_version_at": snapshot.platform_version_at,
+                "created_at": snapshot.created_at,
+            }
+            for snapshot in confirmation.snapshots
+        ]
 
         # Build response
         confirmation_dict = {
             "confirmation_id": confirmation.confirmation_id,
             "trial_id": confirmation.trial_id,
-            "trial_protocol_number": protocol_number,
+            "trial_protocol_number": confirmation.trial.protocol_number,
             "confirmation_type": confirmation.confirmation_type,
             "confirmation_status": confirmation.confirmation_status,
             "due_date": confirmation.due_date,
@@ -198,7 +310,22 @@ class ConfirmationService:
             "snapshots": snapshots,
         }
 
-        return ConfirmationDetail(**confirmation_dict)
+        return ConfirmationDetail.model_validate(confirmation_dict)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _detail_query() -> Select:
+        """Build the confirmation detail query (with its trial and snapshots), bound by "confirmation_id"."""
+        return (
+            select(Confirmation)
+            .options(
+                joinedload(Confirmation.trial, innerjoin=True).load_only(Trial.protocol_number),
+                joinedload(Confirmation.snapshots)
+                .joinedload(LinkSnapshot.system_instance, innerjoin=True)
+                .load_only(SystemInstance.instance_code, SystemInstance.platform_name),
+            )
+            .where(Confirmation.confirmation_id == bindparam("confirmation_id"))
+        )
 
     @staticmethod
     async def update_confirmation(
@@ -229,7 +356,6 @@ class ConfirmationService:
 
         try:
             await db.commit()
-            await db.refresh(confirmation)
             logger.info(f"Confirmation updated: {confirmation_id}")
             return ConfirmationResponse.model_validate(confirmation)
         except IntegrityError as e:
@@ -276,8 +402,8 @@ class ConfirmationService:
             )
 
         # Count validation alerts
-        validation_alerts_query = select(func.count()).select_from(
-            select(TrialSystemLink)
+        validation_alerts_query = (
+            select(func.count(TrialSystemLink.link_id))
             .join(
                 SystemInstance,
                 TrialSystemLink.instance_id == SystemInstance.instance_id,
@@ -286,17 +412,15 @@ class ConfirmationService:
                 and_(
                     TrialSystemLink.trial_id == confirmation.trial_id,
                     TrialSystemLink.unlinked_at.is_(None),
-                    SystemInstance.validation_status_code.in_(["VAL_EXPIRED", "NOT_VALIDATED"]),
+                    SystemInstance.validation_status_code.in_(ALERT_VALIDATION_STATUSES),
                 )
             )
-            .subquery()
         )
         alerts_result = await db.execute(validation_alerts_query)
         confirmation.validation_alerts_count = alerts_result.scalar_one()
 
         try:
             await db.commit()
-            await db.refresh(confirmation)
             logger.info(
                 f"Confirmation submitted: {confirmation_id}, " f"alerts: {confirmation.validation_alerts_count}"
             )
@@ -308,12 +432,36 @@ class ConfirmationService:
 
     @staticmethod
     async def _capture_snapshots(db: AsyncSession, trial_id: UUID, confirmation_id: UUID) -> None:
-        """Capture point-in-time snapshots of trial systems."""
+        """
+        Capture point-in-time snapshots of trial systems.
+
+        The snapshots are copied from the active links and their systems with a
+        single INSERT ... SELECT, so no rows travel to the application and back.
+        """
         logger.info(f"Capturing snapshots for trial {trial_id}, confirmation {confirmation_id}")
 
-        # Get active trial-system links
-        links_query = (
-            select(TrialSystemLink, SystemInstance)
+        # Active trial-system links, shaped like link_snapshots rows
+        snapshot_rows = (
+            select(
+                literal(confirmation_id, LinkSnapshot.confirmation_id.type),
+                TrialSystemLink.link_id,
+                SystemInstance.instance_id,
+                jsonb_object(
+                    instance_code=SystemInstance.instance_code,
+                    platform_name=SystemInstance.platform_name,
+                    platform_version=SystemInstance.platform_version,
+                    category_code=SystemInstance.category_code,
+                    validation_status_code=SystemInstance.validation_status_code,
+                    validation_date=SystemInstance.validation_date,
+                    validation_expiry=SystemInstance.validation_expiry,
+                    hosting_model=SystemInstance.hosting_model,
+                    data_hosting_region=SystemInstance.data_hosting_region,
+                    criticality_code=TrialSystemLink.criticality_code,
+                    assignment_status=TrialSystemLink.assignment_status,
+                ),
+                SystemInstance.validation_status_code,
+                SystemInstance.platform_version,
+            )
             .join(
                 SystemInstance,
                 TrialSystemLink.instance_id == SystemInstance.instance_id,
@@ -326,34 +474,21 @@ class ConfirmationService:
             )
         )
 
-        links_result = await db.execute(links_query)
-        links_data = links_result.all()
-
-        # Create snapshots
-        for link, system in links_data:
-            snapshot = LinkSnapshot(
-                confirmation_id=confirmation_id,
-                link_id=link.link_id,
-                instance_id=system.instance_id,
-                instance_state={
-                    "instance_code": system.instance_code,
-                    "platform_name": system.platform_name,
-                    "platform_version": system.platform_version,
-                    "category_code": system.category_code,
-                    "validation_status_code": system.validation_status_code,
-                    "validation_date": str(system.validation_date) if system.validation_date else None,
-                    "validation_expiry": str(system.validation_expiry) if system.validation_expiry else None,
-                    "hosting_model": system.hosting_model,
-                    "data_hosting_region": system.data_hosting_region,
-                    "criticality_code": link.criticality_code,
-                    "assignment_status": link.assignment_status,
-                },
-                validation_status_at=system.validation_status_code,
-                platform_version_at=system.platform_version,
+        result = await db.execute(
+            insert(LinkSnapshot).from_select(
+                [
+                    LinkSnapshot.confirmation_id,
+                    LinkSnapshot.link_id,
+                    LinkSnapshot.instance_id,
+                    LinkSnapshot.instance_state,
+                    LinkSnapshot.validation_status_at,
+                    LinkSnapshot.platform_version_at,
+                ],
+                snapshot_rows,
             )
-            db.add(snapshot)
+        )
 
-        logger.info(f"Created {len(links_data)} snapshots")
+        logger.info(f"Created {result.rowcount} snapshots")
 
     @staticmethod
     async def generate_export(db: AsyncSession, export_request: ExportRequest, user_email: str) -> ExportResponse:
@@ -377,7 +512,8 @@ class ConfirmationService:
 
         # Generate export (simulated for now - in production would generate actual file)
         export_id = uuid4()
-        file_name = f"confirmation_{confirmation.confirmation_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{export_request.export_format.lower()}"
+        generated_at = datetime.utcnow()
+        file_name = f"confirmation_{confirmation.confirmation_id}_{generated_at.strftime('%Y%m%d_%H%M%S')}.{export_request.export_format.lower()}"
 
         # Update confirmation with export info
         confirmation.export_generated = True
@@ -394,8 +530,8 @@ class ConfirmationService:
             file_name=file_name,
             file_size_bytes=1024 * 500,  # Simulated 500KB
             download_url=f"/api/v1/exports/{export_id}/download",
-            generated_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(days=30),
+            generated_at=generated_at,
+            expires_at=generated_at + timedelta(days=30),
         )
 
         logger.info(f"Export generated: {export_id}, file: {file_name}")
@@ -1,17 +1,72 @@
 """Service layer for lookups/reference data."""
 
-from typing import List
-
-from sqlalchemy import select
+from sqlalchemy import Text, cast, func, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.db.models import Criticality, SystemCategory, ValidationStatus
-from api.models.lookups import CriticalityResponse, LookupsResponse, SystemCategoryResponse, ValidationStatusResponse
+from api.models.lookups import LookupsResponse
+
+# Static enums (from schema constraints)
+VENDOR_TYPES = (
+    "CRO",
+    "FSP",
+    "TECH_VENDOR",
+    "CENTRAL_LAB",
+    "IMAGING",
+    "ECG_VENDOR",
+    "BIOANALYTICAL",
+    "LOGISTICS",
+    "SPECIALTY",
+    "INTERNAL",
+)
+
+HOSTING_MODELS = (
+    "SAAS",
+    "SAAS_ST",
+    "PAAS",
+    "IAAS",
+    "ON_PREM",
+    "HYBRID",
+)
+
+DATA_HOSTING_REGIONS = (
+    "EU",
+    "US",
+    "CHINA",
+    "APAC_OTHER",
+    "UK",
+    "GLOBAL_DISTRIBUTED",
+)
 
 
 class LookupsService:
     """Service for fetching reference/lookup data."""
 
+    @staticmethod
+    async def get_version(db: AsyncSession) -> str:
+        """
+        Get a version stamp of the lookup tables.
+
+        The tables have no update timestamps, so the stamp is a hash of all their
+        rows; they are small enough for this to be a cheap query. It changes with
+        any insert, update or delete, whichever process made it.
+
+        Args:
+            db: Database session
+
+        Returns:
+            str: MD5 of the sorted rows of the lookup tables
+        """
+        rows = union_all(
+            *[
+                select(cast(model.__table__.table_valued(), Text).label("row"))
+                for model in (SystemCategory, ValidationStatus, Criticality)
+            ]
+        ).subquery()
+        ordered_rows = func.string_agg(rows.c.row, aggregate_order_by(literal_column("'|'"), rows.c.row))
+        return await db.scalar(select(func.md5(func.coalesce(ordered_rows, ""))))
+
     @staticmethod
     async def get_all_lookups(db: AsyncSession) -> LookupsResponse:
         """
@@ -41,43 +96,15 @@ class LookupsService:
         )
         criticalities = result.scalars().all()
 
-        # Static enums (from schema constraints)
-        vendor_types = [
-            "CRO",
-            "FSP",
-            "TECH_VENDOR",
-            "CENTRAL_LAB",
-            "IMAGING",
-            "ECG_VENDOR",
-            "BIOANALYTICAL",
-            "LOGISTICS",
-            "SPECIALTY",
-            "INTERNAL",
-        ]
-
-        hosting_models = [
-            "SAAS",
-            "SAAS_ST",
-            "PAAS",
-            "IAAS",
-            "ON_PREM",
-            "HYBRID",
-        ]
-
-        data_hosting_regions = [
-            "EU",
-            "US",
-            "CHINA",
-            "APAC_OTHER",
-            "UK",
-            "GLOBAL_DISTRIBUTED",
-        ]
-
-        return LookupsResponse(
-            system_categories=[SystemCategoryResponse.model_validate(cat) for cat in categories],
-            validation_statuses=[ValidationStatusResponse.model_validate(status) for status in statuses],
-            criticality_levels=[CriticalityResponse.model_validate(crit) for crit in criticalities],
-            vendor_types=vendor_types,
-            hosting_models=hosting_models,
-            data_hosting_regions=data_hosting_regions,
+        # The ORM rows are read by attribute, nested lists included, in a single validation
+        return LookupsResponse.model_validate(
+            {
+                "system_categories": categories,
+                "validation_statuses": statuses,
+                "criticality_levels": criticalities,
+                "vendor_types": VENDOR_TYPES,
+                "hosting_models": HOSTING_MODELS,
+                "data_hosting_regions": DATA_HOSTING_REGIONS,
+            },
+            from_attributes=True,
         )
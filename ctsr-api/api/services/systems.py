@@ -1,49 +1,54 @@
 """Service layer for system instance management."""
 
 import logging
-from datetime import date, datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+import orjson
+from sqlalchemy import JSON, Integer, ScalarSelect, Select, bindparam, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, undefer_group, with_expression
 
 from api.db.models import SystemInstance, SystemInstanceAudit, Trial, TrialSystemLink
 from api.exceptions import ConflictError, NotFoundError, ValidationError
 from api.models.systems import (
-    AuditRecord,
     InterfaceModel,
     SystemCreate,
     SystemDetail,
     SystemListResponse,
     SystemResponse,
     SystemUpdate,
-    TrialLinkSummary,
+    system_list_adapter,
 )
-from api.utils.pagination import PaginationMeta, PaginationParams
+from api.utils.cache import system_response_cache
+from api.utils.pagination import PaginationMeta, PaginationParams, decode_cursor, encode_cursor
+from api.utils.rows import as_dicts, response_columns, stream_dicts
 
 logger = logging.getLogger(__name__)
 
+# Link statuses that count as a system being in use by a trial
+IN_USE_LINK_STATUSES = ("ACTIVE", "CONFIRMED")
+
 
 class SystemService:
     """Service for system instance CRUD operations."""
 
     @staticmethod
-    def _serialize_for_audit(value: Any) -> Any:
-        """Convert values to JSON-serializable forms for audit storage."""
-        if isinstance(value, (datetime, date)):
-            return value.isoformat()
-        if isinstance(value, UUID):
-            return str(value)
-        if isinstance(value, list):
-            return [SystemService._serialize_for_audit(v) for v in value]
-        if isinstance(value, dict):
-            return {k: SystemService._serialize_for_audit(v) for k, v in value.items()}
-        return value
+    def _serialize_for_audit(values: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Convert audit values to their JSON form for storage, or None if there are none.
+
+        orjson writes dates and datetimes in ISO format and UUIDs as strings, in C,
+        at any depth of nested lists and dicts.
+        """
+        return orjson.loads(orjson.dumps(values, default=str)) if values else None
 
     @staticmethod
-    async def _record_audit(
+    def _record_audit(
         db: AsyncSession,
         instance_id: UUID,
         action: str,
@@ -51,16 +56,20 @@ class SystemService:
         old_values: Optional[Dict[str, Any]] = None,
         new_values: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Persist an audit record for a system instance change."""
+        """
+        Add an audit record for a system instance change to the session.
+
+        The record is not flushed here; it is inserted together with the rest of
+        the unit of work when the request's transaction commits.
+        """
         record = SystemInstanceAudit(
             instance_id=instance_id,
             action=action,
             changed_by=changed_by,
-            old_values={k: SystemService._serialize_for_audit(v) for k, v in (old_values or {}).items()} or None,
-            new_values={k: SystemService._serialize_for_audit(v) for k, v in (new_values or {}).items()} or None,
+            old_values=SystemService._serialize_for_audit(old_values),
+            new_values=SystemService._serialize_for_audit(new_values),
         )
         db.add(record)
-        await db.flush()
 
     @staticmethod
     async def list_systems(
@@ -96,30 +105,154 @@ class SystemService:
             f"category: {category_code}, status: {validation_status}"
         )
 
-        # Build query
-        query = select(SystemInstance)
-
-        # Apply filters
-        if category_code:
-            query = query.where(SystemInstance.category_code == category_code)
-        if validation_status:
-            query = query.where(SystemInstance.validation_status_code == validation_status)
-        if data_hosting_region:
-            query = query.where(SystemInstance.data_hosting_region == data_hosting_region)
-        if vendor_id:
-            query = query.where(
+        params = SystemService._filter_params(
+            category_code, validation_status, data_hosting_region, vendor_id, is_active, search
+        )
+        count_query, page_query = SystemService._list_queries(
+            frozenset(params), bool(pagination.cursor), with_total=not pagination.cursor
+        )
+
+        # Fetch one extra row to tell whether there is a next page; offset pages
+        # also carry the total count (not computed when paging by cursor)
+        page_params = SystemService._page_params(pagination, pagination.limit + 1)
+        result = await db.execute(page_query, {**params, **page_params})
+        systems = as_dicts(result)
+
+        total = None
+        if not pagination.cursor:
+            for system in systems:
+                total = system.pop("total")
+            if total is None:
+                # Past the last row the window sees nothing, so count separately unless on the first page
+                total = 0
+                if pagination.offset:
+                    total_result = await db.execute(count_query, params)
+                    total = total_result.scalar_one()
+
+        next_cursor = None
+        if len(systems) > pagination.limit:
+            del systems[pagination.limit :]
+            next_cursor = encode_cursor(systems[-1]["instance_code"])
+
+        logger.info(f"Found {total} systems, returning {len(systems)} items")
+
+        # Reuse rows validated by earlier requests; the rest are validated in one call
+        data = [system_response_cache.get((system["instance_id"], system["updated_at"])) for system in systems]
+        misses = [i for i, response in enumerate(data) if response is None]
+        if misses:
+            for i, response in zip(misses, system_list_adapter.validate_python([systems[i] for i in misses])):
+                data[i] = system_response_cache[(response.instance_id, response.updated_at)] = response
+
+        return SystemListResponse(
+            data=data,
+            meta=PaginationMeta(
+                total=total,
+                limit=pagination.limit,
+                offset=0 if pagination.cursor else pagination.offset,
+                next_cursor=next_cursor,
+            ),
+        )
+
+    @staticmethod
+    def iter_systems(
+        db: AsyncSession,
+        pagination: PaginationParams,
+        category_code: Optional[str] = None,
+        validation_status: Optional[str] = None,
+        data_hosting_region: Optional[str] = None,
+        vendor_id: Optional[UUID] = None,
+        is_active: bool = True,
+        search: Optional[str] = None,
+        user_email: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a page of system instances from a server-side cursor.
+
+        Same filters, ordering and page as list_systems, without the total count.
+
+        Not a generator itself: the cursor is decoded (and a malformed one rejected)
+        when this is called, before a streaming response has started.
+        """
+        logger.info(
+            f"Streaming systems - user: {user_email}, search: {search}, "
+            f"category: {category_code}, status: {validation_status}"
+        )
+
+        params = SystemService._filter_params(
+            category_code, validation_status, data_hosting_region, vendor_id, is_active, search
+        )
+        _, page_query = SystemService._list_queries(frozenset(params), bool(pagination.cursor))
+        page_params = SystemService._page_params(pagination, pagination.limit)
+
+        return stream_dicts(db, page_query, {**params, **page_params})
+
+    @staticmethod
+    def _filter_params(
+        category_code: Optional[str],
+        validation_status: Optional[str],
+        data_hosting_region: Optional[str],
+        vendor_id: Optional[UUID],
+        is_active: Optional[bool],
+        search: Optional[str],
+    ) -> Dict[str, Any]:
+        """Bind values of the list filters that are set, keyed by bind parameter name."""
+        params: Dict[str, Any] = {
+            name: value
+            for name, value in {
+                "category_code": category_code,
+                "validation_status": validation_status,
+                "data_hosting_region": data_hosting_region,
+                "vendor_id": vendor_id,
+                "search": f"%{search}%" if search else None,
+            }.items()
+            if value
+        }
+        if is_active is not None:
+            params["is_active"] = is_active
+        return params
+
+    @staticmethod
+    def _page_params(pagination: PaginationParams, limit: int) -> Dict[str, Any]:
+        """Bind values for the page: the limit, and the cursor's sort key or the offset."""
+        if pagination.cursor:
+            (after_code,) = decode_cursor(pagination.cursor, str)
+            return {"limit": limit, "after_code": after_code}
+        return {"limit": limit, "offset": pagination.offset}
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _list_queries(filters: frozenset[str], by_cursor: bool, with_total: bool = False) -> tuple[Select, Select]:
+        """
+        Build the count and page queries for a combination of list filters.
+
+        With with_total (offset pages only), the page has a "total" column (COUNT(*) OVER (),
+        evaluated before LIMIT/OFFSET), so the count query is only needed past the end of the list.
+
+        Filter values, limit and offset (or the cursor) are bound at execution time, so the
+        statements are built and their SQL cache keys computed once per combination of filters.
+        """
+        clauses = []
+        if "category_code" in filters:
+            clauses.append(SystemInstance.category_code == bindparam("category_code"))
+        if "validation_status" in filters:
+            clauses.append(SystemInstance.validation_status_code == bindparam("validation_status"))
+        if "data_hosting_region" in filters:
+            clauses.append(SystemInstance.data_hosting_region == bindparam("data_hosting_region"))
+        if "vendor_id" in filters:
+            vendor_id = bindparam("vendor_id")
+            clauses.append(
                 or_(
                     SystemInstance.platform_vendor_id == vendor_id,
                     SystemInstance.service_provider_id == vendor_id,
                 )
             )
-        if is_active is not None:
-            query = query.where(SystemInstance.is_active == is_active)
+        if "is_active" in filters:
+            clauses.append(SystemInstance.is_active == bindparam("is_active"))
 
-        # Apply search
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
+        # Search
+        if "search" in filters:
+            search_pattern = bindparam("search")
+            clauses.append(
                 or_(
                     SystemInstance.instance_code.ilike(search_pattern),
                     SystemInstance.platform_name.ilike(search_pattern),
@@ -127,24 +260,19 @@ class SystemService:
                 )
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering
-        query = query.order_by(SystemInstance.instance_code).limit(pagination.limit).offset(pagination.offset)
-
-        # Execute query
-        result = await db.execute(query)
-        systems = result.scalars().all()
+        count_query = select(func.count()).select_from(SystemInstance).where(*clauses)
 
-        logger.info(f"Found {total} systems, returning {len(systems)} items")
-
-        return SystemListResponse(
-            data=[SystemResponse.model_validate(s) for s in systems],
-            meta=PaginationMeta(total=total, limit=pagination.limit, offset=pagination.offset),
-        )
+        # Plain columns; rows are validated as dicts
+        page_query = select(*response_columns(SystemInstance, SystemResponse)).where(*clauses)
+        if by_cursor:
+            # Keyset on the unique sort key: the index seeks straight to the page
+            page_query = page_query.where(SystemInstance.instance_code > bindparam("after_code"))
+        else:
+            if with_total:
+                page_query = page_query.add_columns(func.count().over().label("total"))
+            page_query = page_query.offset(bindparam("offset", type_=Integer))
+        page_query = page_query.order_by(SystemInstance.instance_code).limit(bindparam("limit", type_=Integer))
+        return count_query, page_query
 
     @staticmethod
     async def create_system(db: AsyncSession, system_data: SystemCreate, user_email: str) -> SystemResponse:
@@ -165,59 +293,57 @@ class SystemService:
         """
         logger.info(f"Creating system {system_data.instance_code} by user {user_email}")
 
-        # Check if instance_code already exists
-        existing = await db.execute(
-            select(SystemInstance).where(SystemInstance.instance_code == system_data.instance_code)
-        )
-        if existing.scalar_one_or_none():
-            raise ConflictError(
-                f"System with code '{system_data.instance_code}' already exists",
-                details={"instance_code": system_data.instance_code},
-            )
-
         # Convert interfaces to JSONB format
         interfaces_json = None
         if system_data.interfaces:
             interfaces_json = [interface.model_dump() for interface in system_data.interfaces]
 
-        # Create system instance
-        system = SystemInstance(
-            instance_code=system_data.instance_code,
-            platform_vendor_id=system_data.platform_vendor_id,
-            service_provider_id=system_data.service_provider_id,
-            category_code=system_data.category_code,
-            platform_name=system_data.platform_name,
-            platform_version=system_data.platform_version,
-            instance_name=system_data.instance_name,
-            instance_environment=system_data.instance_environment,
-            validation_status_code=system_data.validation_status_code,
-            validation_date=system_data.validation_date,
-            validation_expiry=system_data.validation_expiry,
-            validation_evidence_link=system_data.validation_evidence_link,
-            hosting_model=system_data.hosting_model,
-            data_hosting_region=system_data.data_hosting_region,
-            description=system_data.description,
-            supported_studies=system_data.supported_studies,
-            interfaces=interfaces_json,
-            part11_compliant=system_data.part11_compliant,
-            annex11_compliant=system_data.annex11_compliant,
-            soc2_certified=system_data.soc2_certified,
-            iso27001_certified=system_data.iso27001_certified,
-            last_major_change_date=system_data.last_major_change_date,
-            last_major_change_desc=system_data.last_major_change_desc,
-            next_planned_change_date=system_data.next_planned_change_date,
-            next_planned_change_desc=system_data.next_planned_change_desc,
-            is_active=True,
-            created_by=user_email,
-            updated_by=user_email,
+        # Create system instance; a duplicate instance_code inserts nothing and returns no row
+        insert_query = (
+            pg_insert(SystemInstance)
+            .values(
+                instance_code=system_data.instance_code,
+                platform_vendor_id=system_data.platform_vendor_id,
+                service_provider_id=system_data.service_provider_id,
+                category_code=system_data.category_code,
+                platform_name=system_data.platform_name,
+                platform_version=system_data.platform_version,
+                instance_name=system_data.instance_name,
+                instance_environment=system_data.instance_environment,
+                validation_status_code=system_data.validation_status_code,
+                validation_date=system_data.validation_date,
+                validation_expiry=system_data.validation_expiry,
+                validation_evidence_link=system_data.validation_evidence_link,
+                hosting_model=system_data.hosting_model,
+                data_hosting_region=system_data.data_hosting_region,
+                description=system_data.description,
+                supported_studies=system_data.supported_studies,
+                interfaces=interfaces_json,
+                part11_compliant=system_data.part11_compliant,
+                annex11_compliant=system_data.annex11_compliant,
+                soc2_certified=system_data.soc2_certified,
+                iso27001_certified=system_data.iso27001_certified,
+                last_major_change_date=system_data.last_major_change_date,
+                last_major_change_desc=system_data.last_major_change_desc,
+                next_planned_change_date=system_data.next_planned_change_date,
+                next_planned_change_desc=system_data.next_planned_change_desc,
+                is_active=True,
+                created_by=user_email,
+                updated_by=user_email,
+            )
+            .on_conflict_do_nothing(index_elements=[SystemInstance.instance_code])
+            .returning(SystemInstance)
         )
 
-        db.add(system)
-
         try:
-            await db.flush()
-            await db.refresh(system)
-            await SystemService._record_audit(
+            # Deferred columns are only returned when undeferred; the response needs the "detail" group
+            system = (await db.scalars(insert_query.options(undefer_group("detail")))).one_or_none()
+            if system is None:
+                raise ConflictError(
+                    f"System with code '{system_data.instance_code}' already exists",
+                    details={"instance_code": system_data.instance_code},
+                )
+            SystemService._record_audit(
                 db=db,
                 instance_id=system.instance_id,
                 action="INSERT",
@@ -252,50 +378,84 @@ class SystemService:
         """
         logger.info(f"Getting system {instance_id} - user: {user_email}")
 
-        # Get system instance
-        result = await db.execute(select(SystemInstance).where(SystemInstance.instance_id == instance_id))
-        system = result.scalar_one_or_none()
+        result = await db.execute(SystemService._detail_query(), {"instance_id": instance_id})
+        system = result.unique().scalar_one_or_none()
 
         if not system:
             raise NotFoundError("System", instance_id)
 
-        # Get linked trials
-        trials_result = await db.execute(
-            select(TrialSystemLink, Trial)
-            .join(Trial, TrialSystemLink.trial_id == Trial.trial_id)
-            .where(TrialSystemLink.instance_id == instance_id)
-            .where(TrialSystemLink.assignment_status.in_(["ACTIVE", "CONFIRMED"]))
-        )
-        trials_data = trials_result.all()
-
-        linked_trials = [
-            TrialLinkSummary(
-                trial_id=trial.trial_id,
-                protocol_number=trial.protocol_number,
-                trial_title=trial.trial_title,
-                criticality_code=link.criticality_code,
-                assignment_status=link.assignment_status,
-            )
-            for link, trial in trials_data
+        # Build the detail, its linked trials and audit history as plain data, validated in one call
+        system_dict = {name: getattr(system, name) for name in SystemResponse.model_fields}
+        system_dict["linked_trials"] = [
+            {
+                "trial_id": link.trial.trial_id,
+                "protocol_number": link.trial.protocol_number,
+                "trial_title": link.trial.trial_title,
+                "criticality_code": link.criticality_code,
+                "assignment_status": link.assignment_status,
+            }
+            for link in system.trial_links
         ]
+        system_dict["audit_history"] = system.audit_history
+        return SystemDetail.model_validate(system_dict)
 
-        # Get audit history (last 20 changes)
-        audit_result = await db.execute(
-            select(SystemInstanceAudit)
-            .where(SystemInstanceAudit.instance_id == instance_id)
-            .order_by(SystemInstanceAudit.changed_at.desc())
-            .limit(20)
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _detail_query() -> Select:
+        """
+        Build the system detail query: the system instance with its active trial links
+        (and their trials) and its recent audit history, in a single statement.
+
+        The instance id is bound at execution time as "instance_id", so the statement is
+        built (and its SQL cache key computed) only once.
+        """
+        return (
+            select(SystemInstance)
+            .options(
+                undefer_group("detail"),
+                with_expression(SystemInstance.audit_history, SystemService._audit_history_json()),
+                joinedload(SystemInstance.trial_links.and_(TrialSystemLink.assignment_status.in_(IN_USE_LINK_STATUSES)))
+                .joinedload(TrialSystemLink.trial, innerjoin=True)
+                .load_only(Trial.protocol_number, Trial.trial_title),
+            )
+            .where(SystemInstance.instance_id == bindparam("instance_id"))
         )
-        audit_records = audit_result.scalars().all()
 
-        audit_history = [AuditRecord.model_validate(record) for record in audit_records]
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _audit_history_json(limit: int = 20) -> ScalarSelect:
+        """
+        Build the most recent audit records of the system instance bound as "instance_id"
+        as a JSON array.
 
-        # Build detail response
-        system_dict = SystemResponse.model_validate(system).model_dump()
-        return SystemDetail(
-            **system_dict,
-            linked_trials=linked_trials,
-            audit_history=audit_history,
+        Rows are shaped like AuditRecord, newest first. The subquery filters on the bound
+        id rather than correlating with the enclosing system instance, so PostgreSQL runs
+        it once (as an InitPlan) instead of once per joined trial link row.
+        """
+        recent = (
+            select(
+                SystemInstanceAudit.audit_id,
+                SystemInstanceAudit.action,
+                SystemInstanceAudit.changed_at,
+                SystemInstanceAudit.changed_by,
+                SystemInstanceAudit.old_values,
+                SystemInstanceAudit.new_values,
+            )
+            .where(SystemInstanceAudit.instance_id == bindparam("instance_id"))
+            .order_by(SystemInstanceAudit.changed_at.desc())
+            .limit(limit)
+            .subquery("recent_audit")
+        )
+        return (
+            select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(recent.table_valued(), recent.c.changed_at.desc())),
+                    literal_column("'[]'::json"),
+                    type_=JSON,
+                )
+            )
+            .select_from(recent)
+            .scalar_subquery()
         )
 
     @staticmethod
@@ -321,15 +481,14 @@ class SystemService:
         logger.info(f"Updating system {instance_id} by user {user_email}")
 
         # Get existing system
-        result = await db.execute(select(SystemInstance).where(SystemInstance.instance_id == instance_id))
+        result = await db.execute(
+            select(SystemInstance).options(undefer_group("detail")).where(SystemInstance.instance_id == instance_id)
+        )
         system = result.scalar_one_or_none()
 
         if not system:
             raise NotFoundError("System", instance_id)
 
-        # Capture state before changes for auditing
-        old_snapshot = SystemResponse.model_validate(system).model_dump()
-
         # Update fields if provided
         update_data = system_data.model_dump(exclude_unset=True)
 
@@ -345,28 +504,33 @@ class SystemService:
                     for interface in update_data["interfaces"]
                 ]
 
-        for field, value in update_data.items():
-            setattr(system, field, value)
+        # Capture the current values of the fields that change for the audit trail
+        old_values = {
+            field: getattr(system, field) for field, value in update_data.items() if getattr(system, field) != value
+        }
+
+        if not old_values:
+            # Nothing differs: no UPDATE, no audit record, and the loaded row is current
+            logger.info(f"No changes for system {instance_id}")
+            return SystemResponse.model_validate(system)
+
+        for field in old_values:
+            setattr(system, field, update_data[field])
 
         system.updated_by = user_email
 
         try:
+            # updated_at comes back from the UPDATE (eager_defaults)
             await db.flush()
-            await db.refresh(system)
-
-            # Compute changed fields for audit trail
-            new_snapshot = SystemResponse.model_validate(system).model_dump()
-            changed_keys = {key for key, new_value in new_snapshot.items() if old_snapshot.get(key) != new_value}
-
-            if changed_keys:
-                await SystemService._record_audit(
-                    db=db,
-                    instance_id=instance_id,
-                    action="UPDATE",
-                    changed_by=user_email,
-                    old_values={k: old_snapshot[k] for k in changed_keys if k in old_snapshot},
-                    new_values={k: new_snapshot[k] for k in changed_keys},
-                )
+
+            SystemService._record_audit(
+                db=db,
+                instance_id=instance_id,
+                action="UPDATE",
+                changed_by=user_email,
+                old_values=old_values,
+                new_values={field: update_data[field] for field in old_values},
+            )
 
             logger.info(f"Updated system {instance_id}")
             return SystemResponse.model_validate(system)
@@ -2,17 +2,20 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Integer, Select, and_, bindparam, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only
+from sqlalchemy.sql.elements import ColumnElement
 
 from api.db.models import SystemInstance, Trial, TrialSystemLink
 from api.exceptions import ConflictError, NotFoundError
 from api.models.trials import (
-    LinkedSystemDetail,
     SystemLinkCreate,
     SystemLinkResponse,
     SystemLinkUpdate,
@@ -21,7 +24,8 @@ from api.models.trials import (
     TrialResponse,
     TrialUpdate,
 )
-from api.utils.pagination import PaginationMeta, PaginationParams
+from api.utils.pagination import PaginationMeta, PaginationParams, decode_cursor, encode_cursor
+from api.utils.rows import as_dicts, response_columns, stream_dicts
 
 logger = logging.getLogger(__name__)
 
@@ -39,19 +43,95 @@ class TrialService:
         therapeutic_area: Optional[str] = None,
         trial_lead_email: Optional[str] = None,
         user_email: str = "system",
-    ) -> tuple[List[Trial], PaginationMeta]:
+    ) -> tuple[List[Dict[str, Any]], PaginationMeta]:
         """List trials with optional filters."""
         logger.info(
             f"Listing trials - user: {user_email}, search: {search}, " f"status: {trial_status}, phase: {trial_phase}"
         )
 
-        # Build base query
-        query = select(Trial)
+        params = TrialService._filter_params(search, trial_status, trial_phase, therapeutic_area, trial_lead_email)
+        filters = frozenset(params)
 
-        # Apply search filter
-        if search:
-            search_term = f"%{search}%"
-            query = query.where(
+        # Get total count (skipped when paging by cursor)
+        total = None
+        if not pagination.cursor:
+            total_result = await db.execute(TrialService._count_query(filters), params)
+            total = total_result.scalar_one()
+
+        # Fetch one extra row to tell whether there is a next page
+        page_query, page_params = TrialService._page(filters, pagination, pagination.limit + 1)
+        result = await db.execute(page_query, {**params, **page_params})
+        trials = as_dicts(result)
+
+        next_cursor = None
+        if len(trials) > pagination.limit:
+            del trials[pagination.limit :]
+            next_cursor = encode_cursor(trials[-1]["protocol_number"])
+
+        logger.info(f"Found {total} trials, returning {len(trials)} items")
+
+        return trials, PaginationMeta(
+            total=total,
+            limit=pagination.limit,
+            offset=0 if pagination.cursor else pagination.offset,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def iter_trials(
+        db: AsyncSession,
+        pagination: PaginationParams,
+        search: Optional[str] = None,
+        trial_status: Optional[str] = None,
+        trial_phase: Optional[str] = None,
+        therapeutic_area: Optional[str] = None,
+        trial_lead_email: Optional[str] = None,
+        user_email: str = "system",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a page of trials from a server-side cursor.
+
+        Same filters, ordering and page as list_trials, without the total count.
+
+        Not a generator itself: the cursor is decoded (and a malformed one rejected)
+        when this is called, before a streaming response has started.
+        """
+        logger.info(
+            f"Streaming trials - user: {user_email}, search: {search}, " f"status: {trial_status}, phase: {trial_phase}"
+        )
+
+        params = TrialService._filter_params(search, trial_status, trial_phase, therapeutic_area, trial_lead_email)
+        page_query, page_params = TrialService._page(frozenset(params), pagination, pagination.limit)
+
+        return stream_dicts(db, page_query, {**params, **page_params})
+
+    @staticmethod
+    def _filter_params(
+        search: Optional[str],
+        trial_status: Optional[str],
+        trial_phase: Optional[str],
+        therapeutic_area: Optional[str],
+        trial_lead_email: Optional[str],
+    ) -> Dict[str, Any]:
+        """Bind values of the list filters that are set, keyed by bind parameter name."""
+        params = {
+            "search": f"%{search}%" if search else None,
+            "trial_status": trial_status,
+            "trial_phase": trial_phase,
+            "therapeutic_area": f"%{therapeutic_area}%" if therapeutic_area else None,
+            "trial_lead_email": trial_lead_email,
+        }
+        return {name: value for name, value in params.items() if value}
+
+    @staticmethod
+    def _filter_clauses(filters: frozenset[str]) -> List[ColumnElement]:
+        """WHERE clauses for a combination of list filters, with values left as bind parameters."""
+        clauses = []
+
+        # Search filter
+        if "search" in filters:
+            search_term = bindparam("search")
+            clauses.append(
                 or_(
                     Trial.protocol_number.ilike(search_term),
                     Trial.trial_title.ilike(search_term),
@@ -59,51 +139,71 @@ class TrialService:
                 )
             )
 
-        # Apply filters
-        if trial_status:
-            query = query.where(Trial.trial_status == trial_status)
-        if trial_phase:
-            query = query.where(Trial.trial_phase == trial_phase)
-        if therapeutic_area:
-            query = query.where(Trial.therapeutic_area.ilike(f"%{therapeutic_area}%"))
-        if trial_lead_email:
-            query = query.where(Trial.trial_lead_email == trial_lead_email)
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply ordering and pagination
-        query = query.order_by(Trial.protocol_number)
-        query = query.limit(pagination.limit).offset(pagination.offset)
-
-        # Execute query
-        result = await db.execute(query)
-        trials = result.scalars().all()
+        if "trial_status" in filters:
+            clauses.append(Trial.trial_status == bindparam("trial_status"))
+        if "trial_phase" in filters:
+            clauses.append(Trial.trial_phase == bindparam("trial_phase"))
+        if "therapeutic_area" in filters:
+            clauses.append(Trial.therapeutic_area.ilike(bindparam("therapeutic_area")))
+        if "trial_lead_email" in filters:
+            clauses.append(Trial.trial_lead_email == bindparam("trial_lead_email"))
+        return clauses
 
-        logger.info(f"Found {total} trials, returning {len(trials)} items")
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _list_query(filters: frozenset[str]) -> Select:
+        """
+        Build the filtered trial list query (plain columns; rows are validated as dicts).
 
-        return list(trials), PaginationMeta(total=total, limit=pagination.limit, offset=pagination.offset)
+        Filter values are bound at execution time, so the statement is built and
+        its SQL cache key computed once per combination of filters.
+        """
+        return select(*response_columns(Trial, TrialResponse)).where(*TrialService._filter_clauses(filters))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _count_query(filters: frozenset[str]) -> Select:
+        """Count the rows matching a combination of list filters directly on the table."""
+        return select(func.count()).select_from(Trial).where(*TrialService._filter_clauses(filters))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _page_query(filters: frozenset[str], by_cursor: bool) -> Select:
+        """Order the filtered list query and restrict it to one page (after a cursor, or at an offset)."""
+        query = TrialService._list_query(filters)
+        if by_cursor:
+            # Keyset on the unique sort key: the index seeks straight to the page
+            query = query.where(Trial.protocol_number > bindparam("after_protocol"))
+        else:
+            query = query.offset(bindparam("offset", type_=Integer))
+        return query.order_by(Trial.protocol_number).limit(bindparam("limit", type_=Integer))
+
+    @staticmethod
+    def _page(filters: frozenset[str], pagination: PaginationParams, limit: int) -> tuple[Select, Dict[str, Any]]:
+        """Pick the page statement for the pagination mode, with its bind values."""
+        if pagination.cursor:
+            (after_protocol,) = decode_cursor(pagination.cursor, str)
+            return TrialService._page_query(filters, True), {"limit": limit, "after_protocol": after_protocol}
+        return TrialService._page_query(filters, False), {"limit": limit, "offset": pagination.offset}
 
     @staticmethod
     async def create_trial(db: AsyncSession, trial_data: TrialCreate, user_email: str) -> TrialResponse:
         """Create a new trial."""
         logger.info(f"Creating trial: {trial_data.protocol_number} by {user_email}")
 
-        # Check for duplicate protocol number
-        existing_query = select(Trial).where(Trial.protocol_number == trial_data.protocol_number)
-        existing_result = await db.execute(existing_query)
-        if existing_result.scalar_one_or_none():
-            raise ConflictError(f"Trial with protocol '{trial_data.protocol_number}' already exists")
-
-        # Create trial
-        trial = Trial(**trial_data.model_dump())
+        # Create trial; a duplicate protocol number inserts nothing and returns no row
+        insert_query = (
+            pg_insert(Trial)
+            .values(**trial_data.model_dump())
+            .on_conflict_do_nothing(index_elements=[Trial.protocol_number])
+            .returning(Trial)
+        )
 
         try:
-            db.add(trial)
+            trial = (await db.scalars(insert_query)).one_or_none()
+            if trial is None:
+                raise ConflictError(f"Trial with protocol '{trial_data.protocol_number}' already exists")
             await db.commit()
-            await db.refresh(trial)
             logger.info(f"Trial created: {trial.trial_id}")
             return TrialResponse.model_validate(trial)
         except IntegrityError as e:
@@ -116,56 +216,29 @@ class TrialService:
         """Get trial details with linked systems."""
         logger.info(f"Fetching trial {trial_id} for user {user_email}")
 
-        # Get trial
-        trial_query = select(Trial).where(Trial.trial_id == trial_id)
-        trial_result = await db.execute(trial_query)
-        trial = trial_result.scalar_one_or_none()
+        trial_result = await db.execute(TrialService._detail_query(), {"trial_id": trial_id})
+        trial = trial_result.unique().scalar_one_or_none()
 
         if not trial:
             raise NotFoundError("Trial", trial_id)
 
-        # Get linked systems
-        links_query = (
-            select(
-                TrialSystemLink,
-                SystemInstance.instance_code,
-                SystemInstance.platform_name,
-                SystemInstance.category_code,
-            )
-            .join(
-                SystemInstance,
-                TrialSystemLink.instance_id == SystemInstance.instance_id,
-            )
-            .where(
-                and_(
-                    TrialSystemLink.trial_id == trial_id,
-                    TrialSystemLink.unlinked_at.is_(None),
-                )
-            )
-            .order_by(TrialSystemLink.linked_at.desc())
-        )
-
-        links_result = await db.execute(links_query)
-        links_data = links_result.all()
-
-        # Build linked systems list
-        linked_systems = []
-        for link, instance_code, platform_name, category_code in links_data:
-            linked_systems.append(
-                LinkedSystemDetail(
-                    link_id=link.link_id,
-                    instance_id=link.instance_id,
-                    instance_code=instance_code,
-                    platform_name=platform_name,
-                    category_code=category_code,
-                    assignment_status=link.assignment_status,
-                    criticality_code=link.criticality_code,
-                    criticality_override_reason=link.criticality_override_reason,
-                    usage_start_date=link.usage_start_date,
-                    usage_end_date=link.usage_end_date,
-                    linked_at=link.linked_at,
-                )
-            )
+        # Build linked systems list (newest link first) as dicts; they are validated together with the detail
+        linked_systems = [
+            {
+                "link_id": link.link_id,
+                "instance_id": link.instance_id,
+                "instance_code": link.system_instance.instance_code,
+                "platform_name": link.system_instance.platform_name,
+                "category_code": link.system_instance.category_code,
+                "assignment_status": link.assignment_status,
+                "criticality_code": link.criticality_code,
+                "criticality_override_reason": link.criticality_override_reason,
+                "usage_start_date": link.usage_start_date,
+                "usage_end_date": link.usage_end_date,
+                "linked_at": link.linked_at,
+            }
+            for link in trial.system_links
+        ]
 
         # Build response
         trial_dict = {
@@ -187,7 +260,36 @@ class TrialService:
             "linked_systems": linked_systems,
         }
 
-        return TrialDetail(**trial_dict)
+        return TrialDetail.model_validate(trial_dict)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _detail_query() -> Select:
+        """
+        Build the trial detail query (trial with its current links and their systems), bound by "trial_id".
+
+        Links and systems only load the columns reported in LinkedSystemDetail.
+        """
+        return (
+            select(Trial)
+            .options(
+                joinedload(Trial.system_links.and_(TrialSystemLink.unlinked_at.is_(None))).options(
+                    load_only(
+                        TrialSystemLink.instance_id,
+                        TrialSystemLink.assignment_status,
+                        TrialSystemLink.criticality_code,
+                        TrialSystemLink.criticality_override_reason,
+                        TrialSystemLink.usage_start_date,
+                        TrialSystemLink.usage_end_date,
+                        TrialSystemLink.linked_at,
+                    ),
+                    joinedload(TrialSystemLink.system_instance, innerjoin=True).load_only(
+                        SystemInstance.instance_code, SystemInstance.platform_name, SystemInstance.category_code
+                    ),
+                )
+            )
+            .where(Trial.trial_id == bindparam("trial_id"))
+        )
 
     @staticmethod
     async def update_trial(db: AsyncSession, trial_id: UUID, trial_data: TrialUpdate, user_email: str) -> TrialResponse:
@@ -229,28 +331,26 @@ class TrialService:
         """Link a system to a trial."""
         logger.info(f"Linking system {link_data.instance_id} to trial {trial_id} by {user_email}")
 
-        # Verify trial exists
-        trial_query = select(Trial).where(Trial.trial_id == trial_id)
-        trial_result = await db.execute(trial_query)
-        if not trial_result.scalar_one_or_none():
-            raise NotFoundError("Trial", trial_id)
-
-        # Verify system exists
-        system_query = select(SystemInstance).where(SystemInstance.instance_id == link_data.instance_id)
-        system_result = await db.execute(system_query)
-        if not system_result.scalar_one_or_none():
-            raise NotFoundError("System", link_data.instance_id)
-
-        # Check for existing active link
-        existing_link_query = select(TrialSystemLink).where(
-            and_(
-                TrialSystemLink.trial_id == trial_id,
-                TrialSystemLink.instance_id == link_data.instance_id,
-                TrialSystemLink.unlinked_at.is_(None),
+        # Verify trial and system exist and are not already linked, in one round trip
+        checks_query = select(
+            exists().where(Trial.trial_id == trial_id).label("trial_exists"),
+            exists().where(SystemInstance.instance_id == link_data.instance_id).label("system_exists"),
+            exists()
+            .where(
+                and_(
+                    TrialSystemLink.trial_id == trial_id,
+                    TrialSystemLink.instance_id == link_data.instance_id,
+                    TrialSystemLink.unlinked_at.is_(None),
+                )
             )
+            .label("link_exists"),
         )
-        existing_result = await db.execute(existing_link_query)
-        if existing_result.scalar_one_or_none():
+        checks = (await db.execute(checks_query)).one()
+        if not checks.trial_exists:
+            raise NotFoundError("Trial", trial_id)
+        if not checks.system_exists:
+            raise NotFoundError("System", link_data.instance_id)
+        if checks.link_exists:
             raise ConflictError(f"System {link_data.instance_id} is already linked to trial {trial_id}")
 
         # Create link
@@ -338,8 +438,7 @@ class TrialService:
 
         # Soft delete
         link.unlinked_by = user_email
-        link.unlinked_at = datetime.utcnow()
-        link.updated_at = datetime.utcnow()
+        link.unlinked_at = link.updated_at = datetime.utcnow()
 
         await db.commit()
         logger.info(f"System unlinked: {link.link_id}")
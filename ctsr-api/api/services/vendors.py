@@ -1,17 +1,19 @@
 """Service layer for vendor management."""
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, Select, bindparam, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.db.models import Vendor
 from api.exceptions import ConflictError, NotFoundError, ValidationError
-from api.models.vendors import VendorCreate, VendorListResponse, VendorResponse, VendorUpdate
+from api.models.vendors import VendorCreate, VendorListResponse, VendorResponse, VendorUpdate, vendor_list_adapter
 from api.utils.pagination import PaginationMeta, PaginationParams
+from api.utils.rows import as_dicts, response_columns
 
 logger = logging.getLogger(__name__)
 
@@ -42,34 +44,73 @@ class VendorService:
         """
         logger.info(f"Listing vendors - user: {user_email}, type: {vendor_type}, active: {is_active}")
 
-        # Build query
-        query = select(Vendor)
-
-        # Apply filters
+        # Bind values of the filters that are set
+        params: Dict[str, Any] = {}
         if vendor_type:
-            query = query.where(Vendor.vendor_type == vendor_type)
+            params["vendor_type"] = vendor_type
         if is_active is not None:
-            query = query.where(Vendor.is_active == is_active)
+            params["is_active"] = is_active
+        count_query, page_query = VendorService._list_queries(frozenset(params))
 
         # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
+        total_result = await db.execute(count_query, params)
         total = total_result.scalar() or 0
 
-        # Apply pagination and ordering
-        query = query.order_by(Vendor.vendor_name).limit(pagination.limit).offset(pagination.offset)
-
         # Execute query
-        result = await db.execute(query)
-        vendors = result.scalars().all()
+        result = await db.execute(page_query, {**params, "limit": pagination.limit, "offset": pagination.offset})
+        vendors = as_dicts(result)
 
         logger.info(f"Found {total} vendors, returning {len(vendors)} items")
 
         return VendorListResponse(
-            data=[VendorResponse.model_validate(v) for v in vendors],
+            data=vendor_list_adapter.validate_python(vendors),
             meta=PaginationMeta(total=total, limit=pagination.limit, offset=pagination.offset),
         )
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _list_queries(filters: frozenset[str]) -> tuple[Select, Select]:
+        """
+        Build the count and page queries for a combination of list filters.
+
+        Filter values, limit and offset are bound at execution time, so the statements
+        are built and their SQL cache keys computed once per combination of filters.
+        """
+        # Plain columns; rows are validated as dicts
+        query = select(*response_columns(Vendor, VendorResponse))
+
+        # Apply filters
+        if "vendor_type" in filters:
+            query = query.where(Vendor.vendor_type == bindparam("vendor_type"))
+        if "is_active" in filters:
+            query = query.where(Vendor.is_active == bindparam("is_active"))
+
+        count_query = select(func.count()).select_from(query.subquery())
+        page_query = (
+            query.order_by(Vendor.vendor_name)
+            .limit(bindparam("limit", type_=Integer))
+            .offset(bindparam("offset", type_=Integer))
+        )
+        return count_query, page_query
+
+    @staticmethod
+    async def get_list_version(db: AsyncSession) -> str:
+        """
+        Get a cheap version stamp of the vendor table.
+
+        Changes whenever a vendor is created, updated (including deactivation) or
+        deleted, so it can stand in for the list contents in an ETag.
+
+        Args:
+            db: Database session
+
+        Returns:
+            str: Row count and latest update time
+        """
+        result = await db.execute(select(func.count(), func.max(Vendor.updated_at)))
+        count, last_updated = result.one()
+        return f"{count}:{last_updated}"
+
     @staticmethod
     async def create_vendor(db: AsyncSession, vendor_data: VendorCreate, user_email: str) -> VendorResponse:
         """
@@ -0,0 +1,18 @@
+"""In-process caches for slowly changing GET responses."""
+
+from cachetools import TTLCache
+
+# Admin dashboard statistics, stored with the version of the tables they were built from and
+# rebuilt when the version in the database differs; the TTL bounds date-dependent counts
+DASHBOARD_CACHE_TTL = 30
+dashboard_cache: TTLCache = TTLCache(maxsize=1, ttl=DASHBOARD_CACHE_TTL)
+
+# Reference data, stored with the lookup tables' version and reloaded when the version
+# in the database differs, so changes reach every worker process
+LOOKUPS_CACHE_TTL = 300
+lookups_cache: TTLCache = TTLCache(maxsize=1, ttl=LOOKUPS_CACHE_TTL)
+
+# Validated system list rows, keyed by (instance_id, updated_at); an update bumps
+# updated_at, so a changed row never matches its old entry
+SYSTEM_RESPONSE_CACHE_TTL = 300
+system_response_cache: TTLCache = TTLCache(maxsize=10_000, ttl=SYSTEM_RESPONSE_CACHE_TTL)
@@ -0,0 +1,64 @@
+"""Conditional GET (ETag / If-None-Match) support for JSON responses."""
+
+import hashlib
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag derived from the response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, etag: str, headers: Optional[Dict[str, str]] = None) -> Optional[Response]:
+    """
+    Build a 304 Not Modified response if the client already holds the ETag.
+
+    Lets a route compare a cheaply computed ETag before building the body.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        headers: Extra headers to send with the 304 (e.g. Cache-Control)
+
+    Returns:
+        Response: Empty 304 response, or None if the client's copy is stale
+    """
+    if not _etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**(headers or {}), "ETag": etag})
+
+
+def etag_response(
+    request: Request, body: bytes, etag: Optional[str] = None, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Build a JSON response carrying an ETag for the body.
+
+    Clients that send the same ETag back in If-None-Match get an empty
+    304 Not Modified instead of the body.
+
+    Args:
+        request: Incoming request
+        body: Serialized JSON response body
+        etag: ETag to send (default: derived from the body)
+        headers: Extra headers to send (e.g. Cache-Control)
+
+    Returns:
+        Response: 200 with the body, or 304 without it
+    """
+    etag = etag or etag_for(body)
+    response = not_modified(request, etag, headers)
+    if response is not None:
+        return response
+    return Response(content=body, media_type="application/json", headers={**(headers or {}), "ETag": etag})
@@ -0,0 +1,39 @@
+"""Newline-delimited JSON streaming for large list endpoints."""
+
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# OpenAPI declaration for list routes that can also stream their rows
+NDJSON_RESPONSES: Dict[int | str, Dict[str, Any]] = {200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Check whether the client asked for an NDJSON stream via the Accept header."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(rows: AsyncIterator[Dict[str, Any]], adapter: TypeAdapter) -> StreamingResponse:
+    """
+    Stream rows as NDJSON, one validated item per line.
+
+    Each row is validated and serialized as it arrives, so neither the page nor
+    its JSON body is held in memory and the first line is sent after the first row.
+
+    Args:
+        rows: Row dicts, typically from a server-side cursor
+        adapter: TypeAdapter for the item response model
+
+    Returns:
+        StreamingResponse: application/x-ndjson response
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for row in rows:
+            yield adapter.dump_json(adapter.validate_python(row)) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
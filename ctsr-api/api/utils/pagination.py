@@ -1,10 +1,14 @@
 """Pagination utilities for list endpoints."""
 
-from typing import TypeVar
+import base64
+from typing import Any, Callable, Optional, TypeVar
 
+import orjson
 from fastapi import Query
 from pydantic import BaseModel, Field
 
+from api.exceptions import ValidationError
+
 T = TypeVar("T")
 
 
@@ -15,21 +19,29 @@ class PaginationParams:
         self,
         limit: int = Query(default=20, ge=1, le=100, description="Number of items per page"),
         offset: int = Query(default=0, ge=0, description="Number of items to skip"),
+        cursor: Optional[str] = Query(
+            default=None,
+            description="Cursor from meta.next_cursor; replaces offset and skips the total count",
+        ),
     ):
         self.limit = limit
         self.offset = offset
+        self.cursor = cursor
 
 
 class PaginationMeta(BaseModel):
     """Pagination metadata for list responses."""
 
-    total: int = Field(..., description="Total number of items")
+    total: Optional[int] = Field(None, description="Total number of items (not computed when paging by cursor)")
     limit: int = Field(..., description="Items per page")
     offset: int = Field(..., description="Number of items skipped")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there is one")
 
     @property
     def has_more(self) -> bool:
         """Check if there are more items available."""
+        if self.total is None:
+            return self.next_cursor is not None
         return self.offset + self.limit < self.total
 
     @property
@@ -38,6 +50,45 @@ class PaginationMeta(BaseModel):
         return (self.offset // self.limit) + 1 if self.limit > 0 else 1
 
     @property
-    def total_pages(self) -> int:
-        """Total number of pages."""
+    def total_pages(self) -> Optional[int]:
+        """Total number of pages, if the total is known."""
+        if self.total is None:
+            return None
         return (self.total + self.limit - 1) // self.limit if self.limit > 0 else 1
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    Args:
+        values: Sort key values (str, date, datetime, UUID or None)
+
+    Returns:
+        str: URL-safe cursor
+    """
+    # default=str covers driver-specific types such as asyncpg's UUID
+    return base64.urlsafe_b64encode(orjson.dumps(values, default=str)).decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """
+    Decode a cursor made by encode_cursor.
+
+    Args:
+        cursor: Cursor from a previous page
+        parsers: One parser per sort key value, e.g. UUID or date.fromisoformat (None is kept as is)
+
+    Returns:
+        tuple: Parsed sort key values
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("unexpected cursor shape")
+        return tuple(None if value is None else parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid pagination cursor", details={"cursor": cursor}) from e
@@ -0,0 +1,47 @@
+"""Helpers for fetching list results as plain dictionaries."""
+
+from typing import Any, AsyncIterator, Dict, List
+
+from pydantic import BaseModel
+from sqlalchemy import Executable
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def response_columns(entity: type, model: type[BaseModel]) -> List[InstrumentedAttribute]:
+    """Columns of an ORM entity named by the fields of a response model."""
+    return [getattr(entity, name) for name in model.model_fields]
+
+
+def as_dicts(result: Result) -> List[Dict[str, Any]]:
+    """
+    Fetch all rows of a column select as dicts.
+
+    Pydantic validates plain dicts much faster than ORM instances (attribute
+    lookups) or RowMapping objects (generic mapping path).
+    """
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+async def iter_dicts(result: AsyncResult) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the rows of a streamed column select as dicts."""
+    keys = list(result.keys())
+    async for row in result:
+        yield dict(zip(keys, row))
+
+
+async def stream_dicts(
+    db: AsyncSession, statement: Executable, params: Dict[str, Any]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the rows of a column select from a server-side cursor as dicts.
+
+    asyncpg only opens cursors inside a transaction, so one is started even when the
+    session is a read-only (autocommit) one; it must be the first use of the session.
+    """
+    await db.connection(execution_options={"isolation_level": "READ COMMITTED"})
+    result = await db.stream(statement, params)
+    async for row in iter_dicts(result):
+        yield row
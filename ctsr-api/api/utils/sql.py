@@ -0,0 +1,22 @@
+"""SQL expression helpers."""
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _object_args(fields: dict) -> list:
+    """Interleave literal keys and values; literal keys let the server infer their type."""
+    args = []
+    for key, value in fields.items():
+        args.extend([literal_column(f"'{key}'"), value])
+    return args
+
+
+def json_object(**fields: ColumnElement) -> ColumnElement:
+    """Build a json_build_object() call from keyword arguments, keeping their order."""
+    return func.json_build_object(*_object_args(fields))
+
+
+def jsonb_object(**fields: ColumnElement) -> ColumnElement:
+    """Build a jsonb_build_object() call from keyword arguments."""
+    return func.jsonb_build_object(*_object_args(fields))
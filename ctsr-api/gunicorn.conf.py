@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for running the CTSR API in production.
+
+Picked up automatically from the working directory:
+    gunicorn api.main:app
+"""
+
+import multiprocessing
+import os
+
+from uvicorn_worker import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """Uvicorn worker pinned to uvloop and httptools, failing at startup if either is missing."""
+
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "loop": "uvloop", "http": "httptools"}
+
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+
+# WEB_CONCURRENCY overrides the usual (2 x CPU cores) + 1
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_class = UvloopWorker
+
+# Import the application once in the master so workers share it copy-on-write.
+# Database engines are created in the lifespan, i.e. per worker after the fork.
+preload_app = True
+
+# Worker heartbeat files on tmpfs rather than the container's overlay filesystem
+worker_tmp_dir = "/dev/shm"
@@ -12,6 +12,9 @@ def main():
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_debug,
+        workers=None if settings.api_debug else settings.web_concurrency,
+        loop="auto",
+        http="httptools",
     )
 
 
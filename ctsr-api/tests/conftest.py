@@ -5,9 +5,10 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from api.config import get_settings
+from api.db.database import get_engine
 from api.main import app
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -39,6 +40,20 @@ async def client():
             yield async_client
 
 
+@pytest_asyncio.fixture
+async def sql_statements(client):
+    """Collect the SQL statements the app sends to the database during a test."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def unique_code() -> str:
     """Generate a short unique suffix for codes to avoid uniqueness conflicts."""
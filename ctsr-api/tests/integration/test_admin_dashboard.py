@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from sqlalchemy import update
+
+from api.db.database import get_session_factory
+from api.db.models import SystemInstance
+from api.services.admin import AdminService
+from api.utils.cache import dashboard_cache
+
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_is_dropped_after_write(client, unique_code):
+    before = await client.get("/api/v1/admin/dashboard")
+    assert before.status_code == 200
+
+    # Served from cache until a write invalidates it
+    cached = await client.get("/api/v1/admin/dashboard")
+    assert cached.json()["generated_at"] == before.json()["generated_at"]
+
+    # System writes are committed by the session dependency after the handler returns
+    system_resp = await client.post(
+        "/api/v1/systems",
+        json={
+            "instance_code": f"DASH_{unique_code.upper()}",
+            "category_code": "EDC",
+            "platform_name": "Dashboard Cache Platform",
+            "validation_status_code": "VALIDATED",
+        },
+    )
+    assert system_resp.status_code == 201
+
+    after = await client.get("/api/v1/admin/dashboard")
+    assert after.json()["systems"]["total_systems"] == before.json()["systems"]["total_systems"] + 1
+
+
+@pytest.mark.asyncio
+async def test_dashboard_is_rebuilt_once(client, monkeypatch):
+    calls = []
+    get_dashboard_json = AdminService.get_dashboard_json
+
+    async def counting_get_dashboard_json(service):
+        calls.append(service)
+        return await get_dashboard_json(service)
+
+    monkeypatch.setattr(AdminService, "get_dashboard_json", counting_get_dashboard_json)
+    dashboard_cache.clear()
+
+    responses = await asyncio.gather(*[client.get("/api/v1/admin/dashboard") for _ in range(5)])
+    assert [r.status_code for r in responses] == [200] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reflects_writes_from_other_processes(client, unique_code):
+    system_resp = await client.post(
+        "/api/v1/systems",
+        json={
+            "instance_code": f"DASHX_{unique_code.upper()}",
+            "category_code": "EDC",
+            "platform_name": "Dashboard Version Platform",
+            "validation_status_code": "VALIDATED",
+        },
+    )
+    assert system_resp.status_code == 201
+    before = await client.get("/api/v1/admin/dashboard")
+
+    # A write committed by another worker never passes through this process's routes
+    async with get_session_factory()() as db:
+        await db.execute(
+            update(SystemInstance)
+            .where(SystemInstance.instance_id == system_resp.json()["instance_id"])
+            .values(is_active=False)
+        )
+        await db.commit()
+
+    after = await client.get("/api/v1/admin/dashboard")
+    assert after.json()["systems"]["active_systems"] == before.json()["systems"]["active_systems"] - 1
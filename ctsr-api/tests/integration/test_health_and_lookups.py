@@ -1,5 +1,10 @@
+import asyncio
+
 import pytest
 
+from api.services.lookups import LookupsService
+from api.utils.cache import lookups_cache
+
 
 @pytest.mark.asyncio
 async def test_health_endpoint(client):
@@ -29,3 +34,71 @@ async def test_lookups_endpoint(client):
 
     assert "CRO" in payload.get("vendor_types", [])
     assert payload.get("data_hosting_regions")
+
+    revalidated = await client.get("/api/v1/lookups", headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_expired_lookups_are_reloaded_once(client, monkeypatch):
+    calls = []
+    get_all_lookups = LookupsService.get_all_lookups
+
+    async def counting_get_all_lookups(db):
+        calls.append(db)
+        return await get_all_lookups(db)
+
+    monkeypatch.setattr(LookupsService, "get_all_lookups", counting_get_all_lookups)
+    lookups_cache.clear()
+
+    responses = await asyncio.gather(*[client.get("/api/v1/lookups") for _ in range(5)])
+    assert [r.status_code for r in responses] == [200] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed(client):
+    compressed = await client.get("/api/v1/lookups", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["vary"]
+
+    identity = await client.get("/api/v1/lookups", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.json() == compressed.json()
+
+    small = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.asyncio
+async def test_lookups_cache_can_be_dropped_by_admin(client):
+    # Preloaded at startup
+    assert "lookups" in lookups_cache
+
+    response = await client.delete("/api/v1/admin/cache/lookups")
+    assert response.status_code == 204
+    assert "lookups" not in lookups_cache
+
+    # Reloaded on the next request
+    response = await client.get("/api/v1/lookups")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "lookups" in lookups_cache
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_reloaded_when_tables_change(client):
+    # A copy cached before the tables changed (e.g. through another worker)
+    lookups_cache["lookups"] = ("outdated-version", b'{"system_categories": []}')
+
+    response = await client.get("/api/v1/lookups")
+    assert response.status_code == 200
+    assert response.json()["system_categories"]
+    assert lookups_cache["lookups"][0] != "outdated-version"
+
+
+@pytest.mark.asyncio
+async def test_health_reuses_recent_database_check(client):
+    first = await client.get("/health")
+    second = await client.get("/health")
+    assert second.json()["timestamp"] == first.json()["timestamp"]
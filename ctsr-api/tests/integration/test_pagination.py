@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_trials_page_by_cursor(client, unique_code):
+    protocols = [f"PAGE-{unique_code}-{n}".upper() for n in range(3)]
+    for protocol_number in protocols:
+        resp = await client.post(
+            "/api/v1/trials",
+            json={"protocol_number": protocol_number, "trial_title": "Pagination Trial", "trial_status": "ACTIVE"},
+        )
+        assert resp.status_code == 201
+
+    first = await client.get("/api/v1/trials", params={"search": f"PAGE-{unique_code}", "limit": 2})
+    assert first.status_code == 200
+    first_body = first.json()
+    assert [t["protocol_number"] for t in first_body["data"]] == protocols[:2]
+    assert first_body["meta"]["total"] == 3
+    assert first_body["meta"]["next_cursor"]
+
+    second = await client.get(
+        "/api/v1/trials",
+        params={"search": f"PAGE-{unique_code}", "limit": 2, "cursor": first_body["meta"]["next_cursor"]},
+    )
+    assert second.status_code == 200
+    second_body = second.json()
+    assert [t["protocol_number"] for t in second_body["data"]] == protocols[2:]
+    assert second_body["meta"]["total"] is None
+    assert second_body["meta"]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_confirmations_cursor_matches_offset_order(client, unique_code):
+    trial_resp = await client.post(
+        "/api/v1/trials",
+        json={"protocol_number": f"PAGE-CONF-{unique_code}".upper(), "trial_title": "Pagination Trial"},
+    )
+    trial_id = trial_resp.json()["trial_id"]
+    for due_date in (None, "2030-01-01", "2030-01-01", "2029-06-30"):
+        resp = await client.post(
+            "/api/v1/confirmations",
+            json={"trial_id": trial_id, "confirmation_type": "PERIODIC", "due_date": due_date},
+        )
+        assert resp.status_code == 201
+
+    everything = await client.get("/api/v1/confirmations", params={"trial_id": trial_id})
+    expected = [c["confirmation_id"] for c in everything.json()["data"]]
+    assert len(expected) == 4
+    assert everything.json()["meta"]["total"] == 4
+    assert "total" not in everything.json()["data"][0]
+
+    past_end = await client.get("/api/v1/confirmations", params={"trial_id": trial_id, "offset": 10})
+    assert past_end.json()["data"] == []
+    assert past_end.json()["meta"]["total"] == 4
+
+    seen, cursor = [], None
+    while True:
+        params = {"trial_id": trial_id, "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        body = (await client.get("/api/v1/confirmations", params=params)).json()
+        seen.extend(c["confirmation_id"] for c in body["data"])
+        cursor = body["meta"]["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client):
+    resp = await client.get("/api/v1/trials", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+    assert resp.json()["message"] == "Invalid pagination cursor"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/v1/trials", "/api/v1/confirmations", "/api/v1/systems"])
+async def test_invalid_cursor_is_rejected_before_streaming(client, path):
+    resp = await client.get(path, params={"cursor": "!!notbase64"}, headers={"Accept": "application/x-ndjson"})
+    assert resp.status_code == 400
+    assert resp.json()["message"] == "Invalid pagination cursor"
+
+
+@pytest.mark.asyncio
+async def test_systems_page_by_cursor(client, unique_code):
+    codes = [f"PAGE_{unique_code}_{n}".upper() for n in range(3)]
+    for instance_code in codes:
+        resp = await client.post(
+            "/api/v1/systems",
+            json={
+                "instance_code": instance_code,
+                "category_code": "EDC",
+                "platform_name": "Pagination Platform",
+                "validation_status_code": "VALIDATED",
+            },
+        )
+        assert resp.status_code == 201
+
+    params = {"search": f"PAGE_{unique_code}", "limit": 2}
+    first_body = (await client.get("/api/v1/systems", params=params)).json()
+    assert [s["instance_code"] for s in first_body["data"]] == codes[:2]
+    assert first_body["meta"]["total"] == 3
+
+    second = await client.get("/api/v1/systems", params={**params, "cursor": first_body["meta"]["next_cursor"]})
+    assert second.status_code == 200
+    second_body = second.json()
+    assert [s["instance_code"] for s in second_body["data"]] == codes[2:]
+    assert second_body["meta"]["total"] is None
+    assert second_body["meta"]["next_cursor"] is None
+
+    past_end = (await client.get("/api/v1/systems", params={**params, "offset": 10})).json()
+    assert past_end["data"] == []
+    assert past_end["meta"]["total"] == 3
+
+    stream_resp = await client.get("/api/v1/systems", params=params, headers={"Accept": "application/x-ndjson"})
+    assert stream_resp.headers["content-type"] == "application/x-ndjson"
+    streamed = [json.loads(line) for line in stream_resp.text.splitlines()]
+    assert [s["instance_code"] for s in streamed] == codes[:2]
+    assert "total" not in streamed[0]
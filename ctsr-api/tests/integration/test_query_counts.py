@@ -0,0 +1,104 @@
+import json
+
+import pytest
+from sqlalchemy import event
+
+from api.db.database import get_engine, get_session_factory
+
+
+@pytest.mark.asyncio
+async def test_detail_endpoints_use_one_query(client, sql_statements, unique_code):
+    system_resp = await client.post(
+        "/api/v1/systems",
+        json={
+            "instance_code": f"QC_{unique_code}".upper(),
+            "category_code": "EDC",
+            "platform_name": "Query Count Platform",
+            "validation_status_code": "VALIDATED",
+        },
+    )
+    instance_id = system_resp.json()["instance_id"]
+    trial_resp = await client.post(
+        "/api/v1/trials",
+        json={"protocol_number": f"QC-{unique_code}".upper(), "trial_title": "Query Count Trial"},
+    )
+    trial_id = trial_resp.json()["trial_id"]
+    link_resp = await client.post(
+        f"/api/v1/trials/{trial_id}/systems",
+        json={"instance_id": instance_id, "criticality_code": "CRIT", "usage_start_date": "2030-01-01"},
+    )
+    assert link_resp.status_code == 201
+    confirmation_resp = await client.post(
+        "/api/v1/confirmations", json={"trial_id": trial_id, "confirmation_type": "PERIODIC"}
+    )
+    confirmation_id = confirmation_resp.json()["confirmation_id"]
+
+    # Each detail is read with its related rows in a single statement
+    for path in (
+        f"/api/v1/systems/{instance_id}",
+        f"/api/v1/trials/{trial_id}",
+        f"/api/v1/confirmations/{confirmation_id}",
+    ):
+        sql_statements.clear()
+        resp = await client.get(path)
+        assert resp.status_code == 200
+        assert len(sql_statements) == 1, sql_statements
+
+
+def _subplans(node: dict) -> list[dict]:
+    """Collect the subplan nodes of an EXPLAIN (FORMAT JSON) plan tree."""
+    found = [node] if "Subplan Name" in node else []
+    for child in node.get("Plans", []):
+        found.extend(_subplans(child))
+    return found
+
+
+@pytest.mark.asyncio
+async def test_system_detail_reads_audit_history_once(client, unique_code):
+    system_resp = await client.post(
+        "/api/v1/systems",
+        json={
+            "instance_code": f"AP_{unique_code}".upper(),
+            "category_code": "EDC",
+            "platform_name": "Audit Plan Platform",
+            "validation_status_code": "VALIDATED",
+        },
+    )
+    instance_id = system_resp.json()["instance_id"]
+    for n in range(3):
+        trial_resp = await client.post(
+            "/api/v1/trials",
+            json={"protocol_number": f"AP{n}-{unique_code}".upper(), "trial_title": "Audit Plan Trial"},
+        )
+        link_resp = await client.post(
+            f"/api/v1/trials/{trial_resp.json()['trial_id']}/systems",
+            json={"instance_id": instance_id, "criticality_code": "CRIT", "usage_start_date": "2030-01-01"},
+        )
+        assert link_resp.status_code == 201
+
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        resp = await client.get(f"/api/v1/systems/{instance_id}")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert resp.status_code == 200
+    assert len(resp.json()["linked_trials"]) == 3
+    assert [audit["action"] for audit in resp.json()["audit_history"]] == ["INSERT"]
+    assert len(executed) == 1
+
+    # The statement returns one row per linked trial; the audit history is still built only once
+    statement, parameters = executed[0]
+    async with get_session_factory()() as db:
+        conn = await db.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    assert plan[0]["Plan"]["Actual Rows"] == 3
+    assert [subplan["Actual Loops"] for subplan in _subplans(plan[0]["Plan"])] == [1]
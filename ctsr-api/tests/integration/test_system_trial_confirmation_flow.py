@@ -1,3 +1,4 @@
+import json
 from datetime import date
 
 import pytest
@@ -40,6 +41,44 @@ async def test_system_trial_confirmation_flow(client, unique_code):
     assert system_resp.status_code == 201
     system_body = system_resp.json()
     instance_id = system_body["instance_id"]
+    assert system_body["description"] == "Integration test system"
+
+    duplicate_system_resp = await client.post(
+        "/api/v1/systems",
+        json={
+            "instance_code": system_code,
+            "category_code": "EDC",
+            "platform_name": "Validation Platform",
+            "validation_status_code": "VALIDATED",
+        },
+    )
+    assert duplicate_system_resp.status_code == 409
+
+    # Lists the system once before the update so its row is cached
+    list_resp = await client.get("/api/v1/systems", params={"search": system_code})
+    assert list_resp.json()["data"][0]["description"] == "Integration test system"
+
+    update_resp = await client.put(
+        f"/api/v1/systems/{instance_id}",
+        json={"description": "Updated integration test system", "supported_studies": [protocol_number]},
+    )
+    assert update_resp.status_code == 200
+    assert update_resp.json()["description"] == "Updated integration test system"
+    assert update_resp.json()["supported_studies"] == [protocol_number]
+
+    list_resp = await client.get("/api/v1/systems", params={"search": system_code})
+    assert list_resp.json()["data"][0]["description"] == "Updated integration test system"
+
+    # Resubmitting the current values changes nothing and is not audited
+    noop_resp = await client.put(
+        f"/api/v1/systems/{instance_id}", json={"description": "Updated integration test system"}
+    )
+    assert noop_resp.status_code == 200
+    assert noop_resp.json()["updated_at"] == update_resp.json()["updated_at"]
+
+    detail_resp = await client.get(f"/api/v1/systems/{instance_id}")
+    assert detail_resp.status_code == 200
+    assert [audit["action"] for audit in detail_resp.json()["audit_history"]] == ["UPDATE", "INSERT"]
 
     trial_resp = await client.post(
         "/api/v1/trials",
@@ -55,6 +94,11 @@ async def test_system_trial_confirmation_flow(client, unique_code):
     assert trial_resp.status_code == 201
     trial_id = trial_resp.json()["trial_id"]
 
+    duplicate_trial_resp = await client.post(
+        "/api/v1/trials", json={"protocol_number": protocol_number, "trial_title": "Duplicate Trial"}
+    )
+    assert duplicate_trial_resp.status_code == 409
+
     link_resp = await client.post(
         f"/api/v1/trials/{trial_id}/systems",
         json={
@@ -68,6 +112,18 @@ async def test_system_trial_confirmation_flow(client, unique_code):
     assert link_body["trial_id"] == trial_id
     assert link_body["instance_id"] == instance_id
 
+    duplicate_resp = await client.post(
+        f"/api/v1/trials/{trial_id}/systems",
+        json={"instance_id": instance_id, "criticality_code": "CRIT"},
+    )
+    assert duplicate_resp.status_code == 409
+
+    missing_resp = await client.post(
+        f"/api/v1/trials/{trial_id}/systems",
+        json={"instance_id": "00000000-0000-0000-0000-000000000000", "criticality_code": "CRIT"},
+    )
+    assert missing_resp.status_code == 404
+
     detail_resp = await client.get(f"/api/v1/trials/{trial_id}")
     assert detail_resp.status_code == 200
     trial_detail = detail_resp.json()
@@ -100,3 +156,19 @@ async def test_system_trial_confirmation_flow(client, unique_code):
     snapshots = detail_conf.get("snapshots", [])
     assert snapshots, "Expected at least one snapshot after submission"
     assert snapshots[0]["instance_id"] == instance_id
+
+    stream_resp = await client.get(
+        "/api/v1/confirmations", params={"trial_id": trial_id}, headers={"Accept": "application/x-ndjson"}
+    )
+    assert stream_resp.status_code == 200
+    assert stream_resp.headers["content-type"] == "application/x-ndjson"
+    streamed = [json.loads(line) for line in stream_resp.text.splitlines()]
+    assert [c["confirmation_id"] for c in streamed] == [confirmation_id]
+    assert streamed[0]["confirmation_status"] == "COMPLETED"
+
+    unlink_resp = await client.delete(f"/api/v1/trials/{trial_id}/systems/{instance_id}")
+    assert unlink_resp.status_code == 204
+    assert unlink_resp.content == b""
+
+    linked_resp = await client.get(f"/api/v1/trials/{trial_id}/systems")
+    assert all(ls["instance_id"] != instance_id for ls in linked_resp.json()["data"])
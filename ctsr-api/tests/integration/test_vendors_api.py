@@ -1,3 +1,5 @@
+from uuid import UUID
+
 import pytest
 
 
@@ -22,6 +24,8 @@ async def test_vendor_crud_flow(client, unique_code):
     created = create_response.json()
 
     vendor_id = created["vendor_id"]
+    # Clients match ids as strings, so keep the canonical hyphenated form
+    assert vendor_id == str(UUID(vendor_id))
     assert created["vendor_code"] == vendor_code
     assert created["vendor_name"] == "Test Vendor"
     assert created["is_active"] is True
@@ -32,6 +36,11 @@ async def test_vendor_crud_flow(client, unique_code):
     assert detail["vendor_id"] == vendor_id
     assert detail["vendor_type"] == "CRO"
 
+    etag = detail_response.headers["etag"]
+    not_modified = await client.get(f"/api/v1/vendors/{vendor_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
     update_response = await client.put(
         f"/api/v1/vendors/{vendor_id}",
         json={"vendor_name": "Updated Vendor", "is_active": False},
@@ -41,6 +50,9 @@ async def test_vendor_crud_flow(client, unique_code):
     assert updated["vendor_name"] == "Updated Vendor"
     assert updated["is_active"] is False
 
+    changed = await client.get(f"/api/v1/vendors/{vendor_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+
     conflict_response = await client.post("/api/v1/vendors", json=create_payload)
     assert conflict_response.status_code == 409
     conflict_body = conflict_response.json()
@@ -51,3 +63,28 @@ async def test_vendor_crud_flow(client, unique_code):
     listed = list_response.json()
     assert "data" in listed and "meta" in listed
     assert listed["meta"]["limit"] == 5
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_vendor_list_is_cacheable(client, unique_code):
+    list_response = await client.get("/api/v1/vendors")
+    assert list_response.status_code == 200
+    assert list_response.headers["cache-control"].startswith("private")
+    etag = list_response.headers["etag"]
+
+    not_modified = await client.get("/api/v1/vendors", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+    filtered = await client.get("/api/v1/vendors", params={"vendor_type": "CRO"})
+    assert "etag" not in filtered.headers
+
+    create_response = await client.post(
+        "/api/v1/vendors",
+        json={"vendor_code": f"TEST_LIST_{unique_code.upper()}", "vendor_name": "List Vendor", "vendor_type": "CRO"},
+    )
+    assert create_response.status_code == 201
+
+    changed = await client.get("/api/v1/vendors", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,168 @@
+"""Tests for authentication and authorization helpers."""
+
+import json
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from api import auth
+from api.config import Settings
+from api.exceptions import AuthenticationError, AuthorizationError
+
+
+@pytest.fixture
+def azure_ad_settings(monkeypatch):
+    """Force production (Azure AD) authentication mode."""
+    settings = Settings(azure_ad_enabled=True, azure_ad_audience="api://ctsr")
+    monkeypatch.setattr(auth, "get_settings", lambda: settings)
+    return settings
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty verified-token cache."""
+    auth._TOKEN_CACHE.clear()
+    yield
+    auth._TOKEN_CACHE.clear()
+
+
+@pytest.fixture(scope="module")
+def rsa_private_pem() -> bytes:
+    """RSA private key used to sign test tokens."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+
+@pytest.fixture
+def signing_key(monkeypatch, rsa_private_pem):
+    """Register the test public key in the JWKS cache under kid 'test-kid'."""
+    public_key = serialization.load_pem_private_key(rsa_private_pem, password=None).public_key()
+    monkeypatch.setitem(auth._JWKS_CACHE, "test-kid", public_key)
+    return rsa_private_pem
+
+
+def _make_token(private_pem: bytes, kid: str = "test-kid", **claims) -> str:
+    payload = {"aud": "api://ctsr", "email": "lead@example.com", "roles": ["CTSR_TRIAL_LEAD"], **claims}
+    return jwt.encode(payload, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.mark.asyncio
+async def test_valid_signed_token_is_accepted(azure_ad_settings, signing_key):
+    user = await auth.get_current_user(authorization=f"Bearer {_make_token(signing_key)}")
+    assert user.email == "lead@example.com"
+    assert user.has_role(auth.TRIAL_LEAD)
+    assert not user.has_role(auth.ADMIN)
+
+
+@pytest.mark.asyncio
+async def test_verified_token_is_served_from_cache(azure_ad_settings, signing_key):
+    header = f"Bearer {_make_token(signing_key)}"
+    first = await auth.get_current_user(authorization=header)
+
+    # Signing key no longer available: only a cache hit can authenticate
+    auth._JWKS_CACHE.pop("test-kid")
+    second = await auth.get_current_user(authorization=header)
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_expired_cached_token_is_revalidated(azure_ad_settings, signing_key):
+    header = f"Bearer {_make_token(signing_key)}"
+    user = await auth.get_current_user(authorization=header)
+    cache_key = next(iter(auth._TOKEN_CACHE))
+    auth._TOKEN_CACHE[cache_key] = (user, 0)
+
+    assert await auth.get_current_user(authorization=header) is not user
+
+
+@pytest.mark.asyncio
+async def test_signing_keys_are_fetched_from_jwks(azure_ad_settings, rsa_private_pem, monkeypatch):
+    public_key = serialization.load_pem_private_key(rsa_private_pem, password=None).public_key()
+    jwks = {"keys": [{**json.loads(RSAAlgorithm.to_jwk(public_key)), "kid": "fetched-kid"}]}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=jwks))
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(auth.httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs))
+    monkeypatch.setattr(auth, "_jwks_fetched_at", None)
+    # Shortly after host boot, the monotonic clock is still below the refresh interval
+    monkeypatch.setattr(auth.time, "monotonic", lambda: 5.0)
+    monkeypatch.delitem(auth._JWKS_CACHE, "fetched-kid", raising=False)
+
+    user = await auth.get_current_user(authorization=f"Bearer {_make_token(rsa_private_pem, kid='fetched-kid')}")
+    assert user.email == "lead@example.com"
+    auth._JWKS_CACHE.pop("fetched-kid")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kid", [["test-kid"], {"id": "test-kid"}, 1])
+async def test_non_string_key_id_is_rejected(azure_ad_settings, signing_key, monkeypatch, kid):
+    token = _make_token(signing_key)
+    monkeypatch.setattr(auth.jwt, "get_unverified_header", lambda _token: {"alg": "RS256", "kid": kid})
+    with pytest.raises(AuthenticationError):
+        await auth.get_current_user(authorization=f"Bearer {token}")
+
+
+@pytest.mark.asyncio
+async def test_token_signed_with_other_key_is_rejected(azure_ad_settings, signing_key):
+    other_pem = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    with pytest.raises(AuthenticationError):
+        await auth.get_current_user(authorization=f"Bearer {_make_token(other_pem)}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "header",
+    [
+        "",
+        "Bearer",
+        "Bearer ",
+        "Basic abc.def.ghi",
+        "Bearer abc def",
+        "Token abc.def.ghi",
+        "Bearer abc.def",
+        "Bearer abc.def.ghi.jkl",
+        "Bearer " + "." * 10_000,
+        "Bearer " + "a" * (auth.MAX_JWT_LENGTH - 1) + ".b.c",
+    ],
+)
+async def test_rejects_malformed_authorization_header(azure_ad_settings, header):
+    with pytest.raises(AuthenticationError):
+        await auth.get_current_user(authorization=header)
+
+
+@pytest.mark.asyncio
+async def test_dev_mode_returns_mock_admin():
+    user = await auth.get_current_user(authorization=None)
+    assert user.is_mock
+    assert user.has_role(auth.ADMIN)
+
+
+@pytest.mark.asyncio
+async def test_role_dependencies():
+    lead = auth.User(email="lead@example.com", roles=[auth.TRIAL_LEAD])
+    admin = auth.User(email="admin@example.com", roles=[auth.ADMIN])
+
+    assert await auth.require_trial_lead(user=lead) is lead
+    assert await auth.require_viewer(user=admin) is admin
+    with pytest.raises(AuthorizationError):
+        await auth.require_viewer(user=lead)
+    with pytest.raises(AuthorizationError):
+        await auth.require_admin(user=lead)
+
+
+@pytest.mark.asyncio
+async def test_require_role_is_shared_per_role():
+    assert auth.require_role("CTSR_CUSTOM") is auth.require_role("CTSR_CUSTOM")
+    assert auth.require_role("CTSR_CUSTOM") is not auth.require_role("CTSR_OTHER")
+
+    user = auth.User(email="custom@example.com", roles=["CTSR_CUSTOM"])
+    assert await auth.require_role("CTSR_CUSTOM")(user=user) is user
+    with pytest.raises(AuthorizationError):
+        await auth.require_role("CTSR_OTHER")(user=user)
@@ -0,0 +1,41 @@
+"""Tests for settings derivation."""
+
+import pytest
+
+from api.config import Settings
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "postgresql://u:p@db:5432/ctsr",
+        "postgres://u:p@db:5432/ctsr",
+        "postgresql+psycopg2://u:p@db:5432/ctsr",
+        "postgresql+asyncpg://u:p@db:5432/ctsr",
+    ],
+)
+def test_database_url_uses_asyncpg(monkeypatch, url):
+    monkeypatch.delenv("TEST_DATABASE_URL", raising=False)
+    monkeypatch.setenv("DATABASE_URL", url)
+    assert Settings().database_url == "postgresql+asyncpg://u:p@db:5432/ctsr"
+
+
+@pytest.mark.parametrize("cache_size, sends_server_settings", [(1024, True), (0, False)])
+def test_pgbouncer_mode_sends_no_startup_parameters(monkeypatch, cache_size, sends_server_settings):
+    from api.db import database
+
+    engine_options = {}
+    create_async_engine = database.create_async_engine
+
+    def create_engine(url, **options):
+        engine_options.update(options)
+        return create_async_engine(url, **options)
+
+    monkeypatch.setattr(database, "get_settings", lambda: Settings(db_statement_cache_size=cache_size))
+    monkeypatch.setattr(database, "create_async_engine", create_engine)
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_async_session_factory", None)
+    monkeypatch.setattr(database, "_readonly_session_factory", None)
+    database.init_db()
+
+    assert ("server_settings" in engine_options["connect_args"]) is sends_server_settings
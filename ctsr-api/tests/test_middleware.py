@@ -0,0 +1,41 @@
+"""Tests for the exception-to-JSON ASGI middleware."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.routing import Route
+
+from api.exceptions import NotFoundError
+from api.middleware import ExceptionMiddleware
+
+
+async def _not_found(request):
+    raise NotFoundError("Vendor", "abc")
+
+
+async def _crash(request):
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def error_client():
+    app = Starlette(
+        routes=[Route("/missing", _not_found), Route("/crash", _crash)],
+        middleware=[Middleware(ExceptionMiddleware)],
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_ctsr_exception_is_rendered_as_json(error_client):
+    response = await error_client.get("/missing")
+    assert response.status_code == 404
+    assert response.json() == {"error": "NOT_FOUND", "message": "Vendor not found: abc", "details": {}}
+
+
+@pytest.mark.asyncio
+async def test_unexpected_exception_returns_500(error_client):
+    response = await error_client.get("/crash")
+    assert response.status_code == 500
+    assert response.json()["error"] == "INTERNAL_SERVER_ERROR"